@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for key reorganization detection.
+
+Compares the original list-based check (O(n*m)) against
+intellator.needs_reorganization (O(n)) on synthetic locale files.
+
+Usage:
+    python benchmarks/reorg_detection.py
+    python benchmarks/reorg_detection.py --sizes 10000 100000 1000000 --legacy-max 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from intellator import needs_reorganization
+
+
+def legacy_needs_reorganization(data, existing_translations):
+    """The original quadratic check, kept here for comparison."""
+    existing_keys = list(existing_translations.keys())
+    parent_keys = list(data.keys())
+    common_keys = [k for k in existing_keys if k in parent_keys]
+    if not common_keys:
+        return False
+    parent_order = [k for k in parent_keys if k in common_keys]
+    return common_keys != parent_order
+
+
+def make_files(size, shuffled):
+    """Build a parent file and an existing translation covering 90% of its keys.
+
+    Args:
+        size: Number of keys in the parent file
+        shuffled: Swap the last two shared keys so a reorganization is detected
+
+    Returns:
+        Tuple of (data, existing_translations)
+    """
+    data = {f"key_{i}": f"value {i}" for i in range(size)}
+    keys = [k for i, k in enumerate(data) if i % 10]
+    if shuffled:
+        keys[-1], keys[-2] = keys[-2], keys[-1]
+    existing = {k: data[k] for k in keys}
+    return data, existing
+
+
+def measure(func, data, existing):
+    """Return (result, seconds) for a single call."""
+    start = time.perf_counter()
+    result = func(data, existing)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark key reorganization detection')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help='Number of keys to test (default: 10000 100000 1000000)')
+    parser.add_argument('--legacy-max', type=int, default=20000,
+                        help='Largest size to run the quadratic check on; larger sizes are '
+                             'extrapolated (default: 20000)')
+    args = parser.parse_args()
+
+    print(f"{'keys':>10}  {'order':>9}  {'linear':>10}  {'legacy':>14}")
+    for size in args.sizes:
+        for shuffled in (False, True):
+            data, existing = make_files(size, shuffled)
+            result, linear = measure(needs_reorganization, data, existing)
+
+            if size <= args.legacy_max:
+                expected, legacy = measure(legacy_needs_reorganization, data, existing)
+                if expected != result:
+                    print(f"Error: results differ for {size} keys")
+                    sys.exit(1)
+                legacy_text = f"{legacy:.4f}s"
+            else:
+                # Quadratic: time the cap size and scale by (size / cap)^2
+                small_data, small_existing = make_files(args.legacy_max, shuffled)
+                _, legacy = measure(legacy_needs_reorganization, small_data, small_existing)
+                legacy_text = f"~{legacy * (size / args.legacy_max) ** 2:.0f}s (est.)"
+
+            order = 'shuffled' if shuffled else 'in order'
+            print(f"{size:>10}  {order:>9}  {linear:>9.4f}s  {legacy_text:>14}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for intellator.py.
+
+Measures the import cost of the module with `python -X importtime` and the
+wall time of short invocations that should never touch the network:
+`--help` and a run where every key is already translated (the pre-commit
+hook case). Each command runs in a fresh interpreter.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 20 --keys 5000 --top 15
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+SCRIPT = os.path.join(REPO, 'intellator.py')
+
+
+def import_times(env):
+    """Import intellator with -X importtime and return (total_us, [(cumulative_us, module)])."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import intellator'],
+        cwd=REPO, env=env, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL,
+        universal_newlines=True, check=True
+    )
+    total = 0
+    modules = []
+    children = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Children are listed before their parent, one indentation level deeper
+        if not name.startswith('   '):
+            if name.strip() == 'intellator':
+                total = int(cumulative)
+                modules = children
+            children = []
+        elif not name.startswith('    '):
+            children.append((int(cumulative), name.strip()))
+    return total, sorted(modules, reverse=True)
+
+
+def wall_times(command, runs, cwd, env):
+    """Run a command repeatedly and return its wall times in seconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, env=env, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark intellator.py startup time')
+    parser.add_argument('--runs', type=int, default=10,
+                        help='Runs per command (default: 10)')
+    parser.add_argument('--keys', type=int, default=1000,
+                        help='Keys in the already-translated locale file (default: 1000)')
+    parser.add_argument('--top', type=int, default=10,
+                        help='Number of slowest direct imports to show (default: 10)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work:
+        # Keep the translation memory of this benchmark away from the user's cache
+        env = dict(os.environ, XDG_CACHE_HOME=os.path.join(work, 'cache'))
+
+        total, modules = import_times(env)
+        print(f"import intellator: {total / 1000:.1f} ms")
+        for cumulative, name in modules[:args.top]:
+            print(f"   {cumulative / 1000:8.1f} ms  {name}")
+
+        # Translate once offline so the measured runs find nothing to do
+        with open(os.path.join(work, 'en.json'), 'w', encoding='utf-8') as f:
+            json.dump({f"key_{i}": f"Value number {i}" for i in range(args.keys)}, f)
+        subprocess.run([sys.executable, SCRIPT, 'en', 'ar', '--backend', 'echo'], cwd=work, env=env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+        commands = [
+            ('--help', [sys.executable, SCRIPT, '--help']),
+            (f'up to date ({args.keys} keys)', [sys.executable, SCRIPT, 'en', 'ar']),
+            ('python -c pass', [sys.executable, '-c', 'pass'])
+        ]
+        print(f"\n{'command':<28} {'min':>9} {'median':>9}")
+        for label, command in commands:
+            times = wall_times(command, args.runs, work, env)
+            print(f"{label:<28} {min(times) * 1000:7.1f}ms {statistics.median(times) * 1000:7.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
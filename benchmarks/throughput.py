@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Offline throughput benchmark for the translation engines.
+
+Generates a synthetic locale file and runs intellator.translate_json against
+an in-process simulated translator, so engine changes can be compared on a
+machine without network access. Results are printed as JSON.
+
+Usage:
+    python benchmarks/throughput.py --keys 5000 -w 16
+    python benchmarks/throughput.py --keys 5000 --engine async -w 100 --batch-size 20
+    python benchmarks/throughput.py --error-rate 0.01 --burst-every 5 --burst-length 0.5 -o run.json
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from intellator import translate_json, BATCH_SEPARATOR, GOOGLE_MAX_CHARS
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+WORDS = ('account', 'settings', 'save', 'cancel', 'profile', 'password', 'email', 'welcome',
+         'back', 'error', 'please', 'try', 'again', 'later', 'your', 'changes', 'have', 'been',
+         'saved', 'delete', 'this', 'item', 'permanently', 'search', 'results', 'for', 'no',
+         'found', 'sign', 'in', 'out', 'up', 'continue', 'with', 'loading', 'terms', 'privacy')
+
+
+class TooManyRequests(Exception):
+    """Simulated HTTP 429, named like the deep_translator exception."""
+
+
+class SimulatedTranslator:
+    """Stand-in for GoogleTranslator with configurable latency and failures.
+
+    Requests sleep for a latency drawn from the chosen distribution. A
+    fraction of them fail with a generic error, and during periodic bursts
+    every request is rejected with TooManyRequests.
+
+    The instance is thread-safe and deep copies return the same object, so
+    the per-thread copies made by the engines share one set of counters.
+    """
+
+    def __init__(self, latency=0.05, distribution='lognormal', sigma=0.5, error_rate=0.0,
+                 burst_every=0.0, burst_length=0.0, seed=0):
+        self.latency = latency
+        self.distribution = distribution
+        self.sigma = sigma
+        self.error_rate = error_rate
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.chars = 0
+        self.latencies = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def _draw_latency(self):
+        if self.distribution == 'fixed' or self.latency <= 0:
+            return self.latency
+        if self.distribution == 'uniform':
+            return self._random.uniform(0, 2 * self.latency)
+        # Log-normal with the requested mean
+        mu = math.log(self.latency) - self.sigma ** 2 / 2
+        return self._random.lognormvariate(mu, self.sigma)
+
+    def _in_burst(self):
+        if not self.burst_every or not self.burst_length:
+            return False
+        return (time.monotonic() - self._started) % self.burst_every < self.burst_length
+
+    def translate(self, text):
+        start = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            self.chars += len(text)
+            delay = self._draw_latency()
+            fail = self._random.random() < self.error_rate
+
+        if self._in_burst():
+            with self._lock:
+                self.throttled += 1
+            raise TooManyRequests("Too many requests (simulated 429)")
+        time.sleep(delay)
+        if fail:
+            with self._lock:
+                self.errors += 1
+            raise Exception("Simulated backend error")
+
+        # Every value in a batched request shares the request latency
+        values = text.count(BATCH_SEPARATOR) + 1
+        with self._lock:
+            self.latencies.extend([time.monotonic() - start] * values)
+        return BATCH_SEPARATOR.join(f"~{line}" for line in text.split(BATCH_SEPARATOR))
+
+
+def generate_locale(keys, value_length=40, duplicate_rate=0.1, seed=0):
+    """Build a synthetic flat locale file.
+
+    Args:
+        keys: Number of keys to generate
+        value_length: Approximate length of each value in characters
+        duplicate_rate: Fraction of values that repeat an earlier value
+        seed: Random seed so runs are reproducible
+
+    Returns:
+        Dictionary mapping keys to English-like strings
+    """
+    rng = random.Random(seed)
+    data = {}
+    values = []
+    for i in range(keys):
+        if values and rng.random() < duplicate_rate:
+            value = rng.choice(values)
+        else:
+            words = []
+            while sum(len(word) + 1 for word in words) < value_length:
+                words.append(rng.choice(WORDS))
+            value = ' '.join(words).capitalize()
+            values.append(value)
+        data[f"section_{i // 100}.key_{i}"] = value
+    return data
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KiB, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB on Linux
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def run_benchmark(args):
+    """Run one benchmark and return the report dictionary."""
+    data = generate_locale(args.keys, args.value_length, args.duplicate_rate, args.seed)
+    translator = SimulatedTranslator(
+        latency=args.latency,
+        distribution=args.distribution,
+        sigma=args.sigma,
+        error_rate=args.error_rate,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        seed=args.seed
+    )
+
+    start = time.perf_counter()
+    _, stats = translate_json(
+        data, {}, translator,
+        max_retries=args.max_retries,
+        workers=args.workers,
+        engine=args.engine,
+        batch_size=args.batch_size,
+        batch_chars=args.batch_chars
+    )
+    wall_time = time.perf_counter() - start
+
+    latencies = sorted(translator.latencies)
+    return {
+        'config': {
+            'keys': args.keys,
+            'value_length': args.value_length,
+            'duplicate_rate': args.duplicate_rate,
+            'engine': args.engine,
+            'workers': args.workers,
+            'batch_size': args.batch_size,
+            'batch_chars': args.batch_chars,
+            'max_retries': args.max_retries,
+            'latency': args.latency,
+            'distribution': args.distribution,
+            'sigma': args.sigma,
+            'error_rate': args.error_rate,
+            'burst_every': args.burst_every,
+            'burst_length': args.burst_length,
+            'seed': args.seed
+        },
+        'wall_time': round(wall_time, 4),
+        'keys_per_second': round(args.keys / wall_time, 2) if wall_time > 0 else None,
+        'translated': stats['translated']['count'],
+        'failed': stats['failed']['count'],
+        'deduplicated': stats['deduplicated'],
+        'requests': translator.requests,
+        'errors': translator.errors,
+        'throttled': translator.throttled,
+        'chars_sent': translator.chars,
+        'latency': {
+            name: round(value, 4) if value is not None else None
+            for name, value in (('p50', percentile(latencies, 0.50)),
+                                ('p95', percentile(latencies, 0.95)),
+                                ('p99', percentile(latencies, 0.99)))
+        },
+        'peak_rss_kb': peak_rss_kb()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline throughput benchmark with a simulated translator')
+
+    # Synthetic input
+    parser.add_argument('--keys', type=int, default=2000,
+                        help='Number of keys in the synthetic locale file (default: 2000)')
+    parser.add_argument('--value-length', type=int, default=40,
+                        help='Approximate characters per value (default: 40)')
+    parser.add_argument('--duplicate-rate', type=float, default=0.1,
+                        help='Fraction of values repeating an earlier value (default: 0.1)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Random seed for the input and the simulated backend (default: 0)')
+
+    # Engine options, same meaning as in intellator.py
+    parser.add_argument('--engine', choices=['thread', 'async'], default='thread',
+                        help='Translation engine (default: thread)')
+    parser.add_argument('-w', '--workers', type=int, default=8,
+                        help='Concurrent requests (default: 8)')
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help='Values per request (default: 1)')
+    parser.add_argument('--batch-chars', type=int, default=GOOGLE_MAX_CHARS,
+                        help=f'Characters per batched request (default: {GOOGLE_MAX_CHARS})')
+    parser.add_argument('--max-retries', type=int, default=3,
+                        help='Attempts per request (default: 3)')
+
+    # Simulated backend
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='Mean request latency in seconds (default: 0.05)')
+    parser.add_argument('--distribution', choices=['fixed', 'uniform', 'lognormal'], default='lognormal',
+                        help='Latency distribution (default: lognormal)')
+    parser.add_argument('--sigma', type=float, default=0.5,
+                        help='Shape of the lognormal distribution (default: 0.5)')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Fraction of requests failing with a generic error (default: 0)')
+    parser.add_argument('--burst-every', type=float, default=0.0,
+                        help='Seconds between HTTP 429 bursts (default: 0 = no bursts)')
+    parser.add_argument('--burst-length', type=float, default=0.0,
+                        help='Duration of each 429 burst in seconds (default: 0)')
+
+    parser.add_argument('-o', '--output', help='Write the JSON report to this file instead of stdout')
+    args = parser.parse_args()
+
+    if args.keys < 1 or args.workers < 1 or args.batch_size < 1 or args.max_retries < 1:
+        print("Error: --keys, --workers, --batch-size and --max-retries must be at least 1")
+        sys.exit(1)
+
+    report = run_benchmark(args)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
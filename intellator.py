@@ -5,143 +5,2895 @@ import os
 import sys
 import argparse
 import time
-from deep_translator import GoogleTranslator
-from tqdm import tqdm
+import html
+import re
+import hashlib
+import sqlite3
+import unicodedata
+import tempfile
+import copy
+import threading
+import bisect
+import random
+import collections
+import contextvars
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from json.encoder import encode_basestring
+
+# deep_translator, tqdm, requests and asyncio are imported where they are
+# first needed, so --help, argument errors and up-to-date runs start fast
+
+
+# Maximum characters GoogleTranslator accepts in a single request
+GOOGLE_MAX_CHARS = 5000
+
+# Separator used to pack several values into one batched request
+BATCH_SEPARATOR = '\n'
+
+# Mobile Google Translate endpoint queried by GoogleTranslator
+GOOGLE_TRANSLATE_URL = 'https://translate.google.com/m'
+_GOOGLE_RESULT_PATTERN = re.compile(r'<div[^>]*class="(?:t0|result-container)"[^>]*>(.*?)</div>', re.S)
+
+# Serializes multi-line console output when targets run in parallel
+_OUTPUT_LOCK = threading.Lock()
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 
 
 def read_json_file(file_path):
     """Read and parse JSON file."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Error: {file_path} not found.")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Error: Invalid JSON format in {file_path}: {e}")
+
+
+def _source_hash(value):
+    """Hash a source value for change detection in the lock file."""
+    if isinstance(value, str):
+        # Same text as json.dumps gives for a string, without building an encoder
+        serialized = encode_basestring(value)
+    else:
+        serialized = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()[:16]
+
+
+def lock_file_path(output_path):
+    """Return the path of the sidecar lock file for an output file."""
+    return f"{output_path}.lock"
+
+
+def read_lock_file(file_path, source_lang):
+    """Read source hashes recorded by a previous run.
+    
+    Args:
+        file_path: Path of the lock file
+        source_lang: Source language of the current run
+    
+    Returns:
+        Dict mapping keys to source hashes, or None if there is no usable lock
+        file. An empty dict is returned when the lock was written for a
+        different source language, so every key is treated as changed.
+    """
+    try:
+        lock = read_json_file(file_path)
+    except (FileNotFoundError, ValueError):
+        return None
+    if not isinstance(lock, dict) or not isinstance(lock.get('source_hashes'), dict):
+        return None
+    if lock.get('source') != source_lang:
+        return {}
+    return lock['source_hashes']
+
+
+def write_lock_file(file_path, source_lang, source_hashes, durable=True):
+    """Record the source hash of every translated key next to the output file."""
+    write_json_file({'source': source_lang, 'source_hashes': source_hashes}, file_path, durable)
+
+
+def journal_path(output_path):
+    """Return the path of the sidecar journal of translations not yet in the output file."""
+    return f"{output_path}.journal"
+
+
+def read_journal(file_path, source_lang):
+    """Read the translations checkpointed by an interrupted run.
+    
+    The journal is a header line ({"source": ...}) followed by one
+    [key, translation, source hash] line per finished key. Lines that can't
+    be parsed (a write torn by a crash) are skipped.
+    
+    Args:
+        file_path: Path of the journal
+        source_lang: Source language of the current run
+    
+    Returns:
+        Dict mapping keys to (translation, source hash) tuples, or None if
+        there is no journal or it was written for another source language
+    """
+    f = _open_journal(file_path, source_lang)
+    if f is None:
+        return None
+    with f:
+        return dict(_journal_entries(f))
+
+
+def _open_journal(file_path, source_lang):
+    """Open a journal positioned after its header, or return None if it is missing or unusable."""
+    try:
+        f = open(file_path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return None
+    try:
+        header = json.loads(f.readline())
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get('source') != source_lang:
+        f.close()
+        return None
+    return f
+
+
+def _journal_entries(f):
+    """Yield (key, (translation, source hash)) pairs from an open journal."""
+    for line in f:
+        try:
+            key, translation, source_hash = json.loads(line)
+        except ValueError:
+            continue
+        yield key, (translation, source_hash)
+
+
+def append_journal(file_path, source_lang, entries, durable=True):
+    """Append (key, translation, source hash) entries to a checkpoint journal.
+    
+    Each checkpoint only writes what finished since the previous one, so
+    checkpointing a long run costs time proportional to the new keys.
+    """
+    with open(file_path, 'a', encoding='utf-8') as f:
+        if f.tell() == 0:
+            f.write(json.dumps({'source': source_lang}) + '\n')
+        f.write(''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries))
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def remove_journal(file_path):
+    """Delete a checkpoint journal once its translations are in the output file."""
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+
+def _error_status(error):
+    """Return the HTTP status code carried by an exception, or None."""
+    # requests and aiohttp errors carry the response status
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None) or getattr(error, 'status', None)
+    if status is None:
+        match = re.search(r'\bHTTP (\d{3})\b', str(error))
+        status = int(match.group(1)) if match else None
+    return status if isinstance(status, int) else None
+
+
+def _is_throttle_error(error):
+    """Return True if an exception signals that the backend is throttling us."""
+    return (type(error).__name__ == 'TooManyRequests' or _error_status(error) == 429
+            or 'too many requests' in str(error).lower())
+
+
+# Exceptions (by class name, so deep_translator needn't be imported) that
+# fail the same way however often the request is repeated
+_PERMANENT_ERRORS = {
+    'LanguageNotSupportedException', 'InvalidSourceOrTargetLanguage', 'NotValidPayload',
+    'NotValidLength', 'AuthorizationException', 'ApiKeyException', 'ValueError', 'TypeError'
+}
+
+
+def classify_error(error):
+    """Classify a failed request as 'throttle', 'transient' or 'permanent'.
+    
+    Throttling and transient errors (network failures, timeouts, HTTP 5xx and
+    anything unrecognized) are worth retrying. Invalid input, unsupported
+    languages, bad credentials and other HTTP 4xx responses are not.
+    """
+    if isinstance(error, CircuitOpenError):
+        # The circuit breaker already gave up on the backend
+        return 'permanent'
+    if _is_throttle_error(error):
+        return 'throttle'
+    if type(error).__name__ in _PERMANENT_ERRORS:
+        return 'permanent'
+    status = _error_status(error)
+    if status is not None and 400 <= status < 500 and status != 408:
+        return 'permanent'
+    return 'transient'
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at a fixed rate.
+    
+    reserve() takes tokens immediately (going into debt if needed) and returns
+    how long the caller must wait before using them, so the same bucket works
+    for both blocking threads and asyncio tasks.
+    """
+    
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, tokens=1):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def drain(self):
+        """Drop any accumulated burst so callers back off immediately."""
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = time.monotonic()
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on in-flight requests.
+    
+    The limit grows by one request per round trip while the backend is
+    healthy and is halved when it throttles us (HTTP 429) or latency climbs
+    well above the best observed latency.
+    """
+    
+    # Latency above this multiple of the baseline counts as congestion
+    LATENCY_TOLERANCE = 3.0
+    
+    def __init__(self, max_limit, min_limit=1):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = float(max_limit)
+        self._in_flight = 0
+        self._baseline = None
+        self._condition = threading.Condition()
+    
+    def try_acquire(self):
+        with self._condition:
+            if self._in_flight < int(self.limit):
+                self._in_flight += 1
+                return True
+            return False
+    
+    def acquire(self):
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+    
+    def release(self, latency, throttled=False, failed=False):
+        with self._condition:
+            self._in_flight -= 1
+            if not failed:
+                # Slowly forget old minimums so the baseline can follow the backend
+                self._baseline = latency if self._baseline is None else min(self._baseline * 1.01, latency)
+            congested = throttled or (
+                not failed and latency > self._baseline * self.LATENCY_TOLERANCE
+            )
+            if congested:
+                self.limit = max(self.min_limit, self.limit / 2)
+            elif not failed:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request once the circuit breaker gave up on the backend."""
+
+
+# Time by which the value being sent must be done retrying (see _send_request)
+_request_deadline = contextvars.ContextVar('request_deadline', default=None)
+
+
+class CircuitBreaker:
+    """Stop sending requests while the backend is throttling or failing.
+    
+    Closed, requests flow and their outcomes are kept for the last window
+    requests. When at least threshold of them failed with throttling or
+    transient errors, the breaker opens and every request waits for the
+    cooldown. It then turns half-open and lets a single probe through: a
+    failed probe reopens it with twice the cooldown, a successful one closes
+    it again at half the request rate seen before it opened, doubling every
+    cooldown until the old rate is reached.
+    
+    After max_probes failed probes in a row the breaker gives up: waiting
+    and later requests fail with CircuitOpenError (carrying the last error)
+    so the run ends instead of waiting out the outage. A request whose wait
+    would pass its retry deadline fails the same way.
+    
+    Only dispatch waits; translation memory hits, checkpoints and writes
+    carry on. One instance is shared by every worker and target of a run.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+    FAILED = 'failed'
+    
+    # How often waiting requests check whether the probe has finished
+    PROBE_POLL_INTERVAL = 0.05
+    
+    def __init__(self, threshold=0.5, window=20, min_requests=10, cooldown=10.0, max_cooldown=300.0, max_probes=3):
+        self.threshold = threshold
+        self.min_requests = min_requests
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_probes = max_probes
+        self.state = self.CLOSED
+        self.trips = 0
+        self._cooldown = cooldown
+        self._opened_at = 0.0
+        self._probing = False
+        self._failed_probes = 0
+        self._last_error = None
+        self._outcomes = collections.deque(maxlen=window)
+        self._recovery = None
+        self._recovery_target = None
+        self._recovery_step_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _admit(self):
+        """Return (seconds to wait, admitted) for a request about to be sent."""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.FAILED:
+                raise CircuitOpenError(f"Backend kept failing, gave up after {self.max_probes} probes: "
+                                       f"{self._last_error}")
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self._cooldown - now
+                if remaining > 0:
+                    return remaining, False
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    return self.PROBE_POLL_INTERVAL, False
+                self._probing = True
+                return 0.0, True
+            if self._recovery is not None:
+                return self._recovery.reserve(1), True
+            return 0.0, True
+    
+    def _check_deadline(self, delay, deadline):
+        if deadline is not None and time.monotonic() + delay > deadline:
+            raise CircuitOpenError(f"Backend kept failing past the retry deadline: {self._last_error}")
+    
+    def acquire(self, deadline=None):
+        """Wait until a request may be sent, failing if that is after deadline (a monotonic time)."""
+        while True:
+            delay, admitted = self._admit()
+            if not admitted:
+                self._check_deadline(delay, deadline)
+            if delay > 0:
+                time.sleep(delay)
+            if admitted:
+                return
+    
+    async def acquire_async(self, deadline=None):
+        import asyncio
+        while True:
+            delay, admitted = self._admit()
+            if not admitted:
+                self._check_deadline(delay, deadline)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if admitted:
+                return
+    
+    def release(self, error=None):
+        # Permanent errors (bad input, unknown language) mean the backend is answering
+        failed = error is not None and classify_error(error) != 'permanent'
+        with self._lock:
+            now = time.monotonic()
+            if failed:
+                self._last_error = error
+            if self.state == self.HALF_OPEN:
+                if not failed:
+                    self._close(now)
+                else:
+                    self._failed_probes += 1
+                    if self._failed_probes >= self.max_probes:
+                        self.state = self.FAILED
+                        print(f"\n❌ Backend still failing after {self._failed_probes} probes, "
+                              f"giving up on the remaining requests")
+                    else:
+                        self._open(now, min(self.max_cooldown, self._cooldown * 2))
+            elif self.state == self.CLOSED:
+                self._outcomes.append((now, failed))
+                failures = sum(1 for _, outcome_failed in self._outcomes if outcome_failed)
+                if len(self._outcomes) >= self.min_requests and failures >= self.threshold * len(self._outcomes):
+                    self._open(now, self.base_cooldown)
+                elif not failed and self._recovery is not None and now >= self._recovery_step_at:
+                    self._ramp_up(now)
+    
+    def _open(self, now, cooldown):
+        if self.state == self.CLOSED:
+            # Remember the healthy rate to recover towards
+            span = now - self._outcomes[0][0]
+            rate = len(self._outcomes) / span if span > 0 else None
+            if self._recovery is not None:
+                rate = self._recovery_target
+            self._recovery_target = rate
+            self.trips += 1
+            print(f"\n⏸️  Backend is failing, pausing all requests for {cooldown:g}s...")
+        self.state = self.OPEN
+        self._opened_at = now
+        self._cooldown = cooldown
+        self._recovery = None
+        self._outcomes.clear()
+    
+    def _close(self, now):
+        self.state = self.CLOSED
+        self._cooldown = self.base_cooldown
+        self._failed_probes = 0
+        if self._recovery_target:
+            rate = max(1.0, self._recovery_target / 2)
+            self._recovery = TokenBucket(rate, capacity=1)
+            self._recovery_step_at = now + self.base_cooldown
+            print(f"\n▶️  Backend recovered, resuming at {rate:.1f} requests/s")
+        else:
+            print("\n▶️  Backend recovered, resuming")
+    
+    def _ramp_up(self, now):
+        rate = self._recovery.rate * 2
+        if rate >= self._recovery_target:
+            self._recovery = None
+        else:
+            self._recovery = TokenBucket(rate, capacity=1)
+            self._recovery_step_at = now + self.base_cooldown
+
+
+class RateLimiter:
+    """Shared request gate combining requests/sec and chars/sec token buckets
+    with optional adaptive concurrency and circuit breaker.
+    
+    One instance is shared by every worker and target of a run.
+    """
+    
+    def __init__(self, requests_per_second=None, chars_per_second=None, max_concurrency=None, breaker=None):
+        self.requests = TokenBucket(requests_per_second) if requests_per_second else None
+        self.chars = TokenBucket(chars_per_second) if chars_per_second else None
+        self.concurrency = AdaptiveConcurrency(max_concurrency) if max_concurrency else None
+        self.breaker = breaker
+    
+    def _reserve(self, chars):
+        delay = 0.0
+        if self.requests:
+            delay = max(delay, self.requests.reserve(1))
+        if self.chars:
+            delay = max(delay, self.chars.reserve(chars))
+        return delay
+    
+    def acquire(self, chars):
+        if self.breaker:
+            self.breaker.acquire(_request_deadline.get())
+        if self.concurrency:
+            self.concurrency.acquire()
+        delay = self._reserve(chars)
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self, chars):
+        import asyncio
+        if self.breaker:
+            await self.breaker.acquire_async(_request_deadline.get())
+        if self.concurrency:
+            while not self.concurrency.try_acquire():
+                await asyncio.sleep(0.01)
+        delay = self._reserve(chars)
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def release(self, latency, error=None):
+        throttled = error is not None and _is_throttle_error(error)
+        if throttled and self.requests:
+            self.requests.drain()
+        if self.concurrency:
+            self.concurrency.release(latency, throttled=throttled, failed=error is not None)
+        if self.breaker:
+            self.breaker.release(error)
+
+
+class RateLimitedTranslator:
+    """Wraps a translator so every request passes through a shared RateLimiter."""
+    
+    def __init__(self, translator, limiter):
+        self.translator = translator
+        self.limiter = limiter
+    
+    def __deepcopy__(self, memo):
+        # Per-thread copies get their own translator but share the limiter
+        return RateLimitedTranslator(copy.deepcopy(self.translator, memo), self.limiter)
+    
+    def _limited(self, text, send):
+        self.limiter.acquire(len(text))
+        start = time.monotonic()
+        try:
+            result = send()
+        except Exception as e:
+            self.limiter.release(time.monotonic() - start, e)
+            raise
+        self.limiter.release(time.monotonic() - start)
+        return result
+    
+    def translate(self, text):
+        return self._limited(text, lambda: self.translator.translate(text))
+    
+    def translate_batch(self, texts):
+        return self._limited(BATCH_SEPARATOR.join(texts), lambda: _translate_batch(self.translator, texts))
+
+
+class RetryPolicy:
+    """Decide whether and how long to wait before repeating a failed request.
+    
+    Only throttling and transient errors are retried, after a decorrelated
+    jitter backoff (each delay drawn between the base delay and three times
+    the previous one, capped at max_delay; throttling starts from a longer
+    base). Retrying stops once a value has used max_attempts requests, once
+    the next attempt would start after its deadline, or once retries exceed
+    the budget: min_budget plus a budget fraction of the values attempted.
+    
+    One instance is shared by every worker of a target, so the budget keeps
+    a struggling backend from turning the run into a retry storm.
+    """
+    
+    THROTTLE_DELAY_FACTOR = 4
+    
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=30.0, deadline=60.0, budget=0.2,
+                 min_budget=10, metrics=None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.budget = budget
+        self.min_budget = min_budget
+        self.metrics = metrics
+        self._values = 0
+        self._retries = 0
+        self._random = random.Random()
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Register a new value and return its start time for next_delay()."""
+        with self._lock:
+            self._values += 1
+        return time.monotonic()
+    
+    def deadline_for(self, started):
+        """Return the monotonic time after which a value started at started gives up, or None."""
+        return started + self.deadline if self.deadline is not None else None
+    
+    def next_delay(self, error, attempt, previous_delay, started):
+        """Return the seconds to wait before the next attempt, or None to give up.
+        
+        Args:
+            error: Exception raised by the failed attempt
+            attempt: Number of attempts made so far for this value
+            previous_delay: Delay returned for the previous attempt (0 at first)
+            started: Start time of the value, as returned by start()
+        """
+        kind = classify_error(error)
+        if kind == 'permanent':
+            return self._decide('give_up', 'permanent')
+        if attempt >= self.max_attempts:
+            return self._decide('give_up', 'attempts')
+        
+        base = self.base_delay * (self.THROTTLE_DELAY_FACTOR if kind == 'throttle' else 1)
+        with self._lock:
+            delay = min(self.max_delay, self._random.uniform(base, max(base, previous_delay) * 3))
+            if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+                reason = 'deadline'
+            elif self.budget is not None and self._retries >= self.min_budget + self.budget * self._values:
+                reason = 'budget'
+            else:
+                reason = None
+                self._retries += 1
+        if reason is not None:
+            return self._decide('give_up', reason)
+        return self._decide('retry', kind, delay)
+    
+    def _decide(self, decision, reason, delay=None):
+        if self.metrics is not None:
+            self.metrics.record_retry_decision(decision, reason, delay or 0.0)
+        return delay
+
+
+class TargetMetrics:
+    """Thread-safe counters and phase timings for one target language.
+    
+    Collected when --metrics-json or --metrics-prom is given. Requests are
+    recorded by MeteredTranslator / MeteredBackend; a request repeating text
+    whose previous request failed counts as a retry.
+    """
+    
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+        self.phases = {}
+        self.keys = {}
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.retries = 0
+        self.chars_sent = 0
+        self.bytes_sent = 0
+        self.chars_received = 0
+        self.latency_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.retry_decisions = {'retry': {}, 'give_up': {}}
+        self.retry_wait = 0.0
+        self._failed_texts = set()
+        self._lock = threading.Lock()
+    
+    def add_time(self, phase, seconds):
+        """Add wall time spent in a phase (read_input, load_existing, plan, translate, write)."""
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+    
+    def record_request(self, text, latency, result=None, error=None):
+        with self._lock:
+            self.requests += 1
+            self.chars_sent += len(text)
+            self.bytes_sent += len(text.encode('utf-8'))
+            self.latency_counts[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+            self.latency_sum += latency
+            if text in self._failed_texts:
+                self.retries += 1
+                self._failed_texts.discard(text)
+            if error is not None:
+                self.errors += 1
+                if _is_throttle_error(error):
+                    self.throttled += 1
+                self._failed_texts.add(text)
+            elif isinstance(result, str):
+                self.chars_received += len(result)
+    
+    def record_retry_decision(self, decision, reason, delay=0.0):
+        """Count a RetryPolicy decision ('retry' or 'give_up') and its reason."""
+        with self._lock:
+            reasons = self.retry_decisions[decision]
+            reasons[reason] = reasons.get(reason, 0) + 1
+            self.retry_wait += delay
+    
+    def record_stats(self, stats):
+        """Add key counts from a translate_json stats dict."""
+        with self._lock:
+            for name, value in (('total', stats.get('total_keys', 0)),
+                                ('translated', stats['translated']['count']),
+                                ('skipped', stats['skipped']['count']),
+                                ('failed', stats['failed']['count']),
+                                ('changed', stats['changed']['count']),
+                                ('memory_hits', stats.get('memory_hits', 0)),
+                                ('deduplicated', stats.get('deduplicated', 0))):
+                self.keys[name] = self.keys.get(name, 0) + value
+    
+    def to_dict(self):
+        """Return a JSON-serializable snapshot of the metrics."""
+        with self._lock:
+            buckets = {}
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), self.latency_counts):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+            return {
+                'source': self.source,
+                'target': self.target,
+                'phases': {name: round(seconds, 6) for name, seconds in self.phases.items()},
+                'keys': dict(self.keys),
+                'requests': {
+                    'count': self.requests,
+                    'errors': self.errors,
+                    'throttled': self.throttled,
+                    'retries': self.retries
+                },
+                'retry_policy': {
+                    'retry': dict(self.retry_decisions['retry']),
+                    'give_up': dict(self.retry_decisions['give_up']),
+                    'wait_seconds': round(self.retry_wait, 6)
+                },
+                'chars_sent': self.chars_sent,
+                'bytes_sent': self.bytes_sent,
+                'chars_received': self.chars_received,
+                'latency': {
+                    'buckets': buckets,
+                    'sum': round(self.latency_sum, 6),
+                    'count': self.requests
+                }
+            }
+
+
+class MeteredTranslator:
+    """Wraps a translator to record every request in a TargetMetrics."""
+    
+    def __init__(self, translator, metrics):
+        self.translator = translator
+        self.metrics = metrics
+    
+    def __deepcopy__(self, memo):
+        # Per-thread copies get their own translator but share the metrics
+        return MeteredTranslator(copy.deepcopy(self.translator, memo), self.metrics)
+    
+    def translate(self, text):
+        start = time.monotonic()
+        try:
+            result = self.translator.translate(text)
+        except Exception as e:
+            self.metrics.record_request(text, time.monotonic() - start, error=e)
+            raise
+        self.metrics.record_request(text, time.monotonic() - start, result)
+        return result
+    
+    def translate_batch(self, texts):
+        text = BATCH_SEPARATOR.join(texts)
+        start = time.monotonic()
+        try:
+            result = _translate_batch(self.translator, texts)
+        except Exception as e:
+            self.metrics.record_request(text, time.monotonic() - start, error=e)
+            raise
+        self.metrics.record_request(text, time.monotonic() - start, BATCH_SEPARATOR.join(result))
+        return result
+
+
+class _PendingRequest:
+    """A batch of (key, value) pairs to send, with its retry state."""
+    
+    __slots__ = ('batch', 'attempt', 'delay', 'started', 'ready_at')
+    
+    def __init__(self, batch):
+        self.batch = batch
+        self.attempt = 0
+        self.delay = 0.0
+        self.started = None
+        self.ready_at = 0.0
+    
+    @property
+    def texts(self):
+        return [value for _, value in self.batch]
+    
+    @property
+    def label(self):
+        if len(self.batch) == 1:
+            return self.batch[0][0]
+        return f"{self.batch[0][0]} (+{len(self.batch) - 1})"
+
+
+def _handle_response(request, translations, error, retry_policy, progress_bar=None, verbose=False):
+    """Turn the outcome of one attempt into finished results and follow-up requests.
+    
+    A retryable failure schedules the same request again at its ready_at
+    time instead of sleeping. A batch that can't be split back, or whose
+    retries are exhausted, is resent as one request per key.
+    
+    Args:
+        request: _PendingRequest that was sent
+        translations: List of translated texts, or None if the attempt failed
+        error: Exception raised by the attempt, if any
+        retry_policy: RetryPolicy deciding whether to retry
+        progress_bar: Optional tqdm progress bar
+        verbose: Whether to show verbose output
+    
+    Returns:
+        Tuple of (results, follow_ups): (key, translated_text, error) tuples
+        that are done, and _PendingRequest objects still to send
+    """
+    batch = request.batch
+    if error is not None:
+        delay = retry_policy.next_delay(error, request.attempt, request.delay, request.started)
+        if delay is not None:
+            request.delay = delay
+            request.ready_at = time.monotonic() + delay
+            if verbose and progress_bar is not None:
+                progress_bar.set_postfix_str(f"Retry {request.attempt}/{retry_policy.max_attempts}: {request.label[:20]}...")
+            return [], [request]
+        if len(batch) == 1:
+            return [(batch[0][0], None, error)], []
+    elif len(batch) == 1:
+        return [(batch[0][0], translations[0], None)], []
+    elif len(translations) == len(batch):
+        return [(key, part, None) for (key, _), part in zip(batch, translations)], []
+    
+    # Batch could not be split reliably (or kept failing), translate each value on its own
+    return [], [_PendingRequest([item]) for item in batch]
+
+
+def _send_request(translator, request, retry_policy, progress_bar=None, verbose=False):
+    """Send one attempt of a request; see _handle_response for the return value."""
+    if request.started is None:
+        request.started = retry_policy.start()
+    request.attempt += 1
+    # Lets the circuit breaker fail the request instead of waiting past its deadline
+    token = _request_deadline.set(retry_policy.deadline_for(request.started))
+    try:
+        if len(request.batch) == 1:
+            translations = [translator.translate(request.batch[0][1])]
+        else:
+            translations = _translate_batch(translator, request.texts)
+        error = None
+    except Exception as e:
+        translations, error = None, e
+    finally:
+        _request_deadline.reset(token)
+    return _handle_response(request, translations, error, retry_policy, progress_bar, verbose)
+
+
+def _translate_joined(translator, texts):
+    """Translate texts with a single newline-joined translate() request.
+    
+    Returns the response split back into lines; the engines fall back to one
+    request per text when the number of lines doesn't match.
+    """
+    translated_text = translator.translate(BATCH_SEPARATOR.join(texts))
+    if translated_text is None:
+        return []
+    return [part.strip() for part in translated_text.split(BATCH_SEPARATOR)]
+
+
+def _translate_batch(translator, texts):
+    """Translate a batch with translator.translate_batch(), or a joined request if it has none."""
+    translate_batch = getattr(translator, 'translate_batch', None)
+    if translate_batch is None:
+        return _translate_joined(translator, texts)
+    return translate_batch(texts)
+
+
+def _make_batches(pending, batch_size=1, max_chars=GOOGLE_MAX_CHARS):
+    """Group pending (key, value) pairs into batches for multi-string requests.
+    
+    Values are packed in order until a batch holds batch_size values or the
+    joined text would exceed max_chars. Values that contain the separator or
+    are blank are always sent on their own, since they can't be split back
+    reliably.
+    
+    Args:
+        pending: List of (key, value) pairs to translate
+        batch_size: Maximum number of values per request (1 disables batching)
+        max_chars: Provider character limit for a single request
+    
+    Returns:
+        List of batches, each a list of (key, value) pairs
+    """
+    if batch_size <= 1:
+        return [[item] for item in pending]
+    
+    batches = []
+    batch = []
+    batch_chars = 0
+    for key, value in pending:
+        if BATCH_SEPARATOR in value or not value.strip():
+            batches.append([(key, value)])
+            continue
+        added_chars = len(value) + (len(BATCH_SEPARATOR) if batch else 0)
+        if batch and (len(batch) >= batch_size or batch_chars + added_chars > max_chars):
+            batches.append(batch)
+            batch = []
+            batch_chars = 0
+            added_chars = len(value)
+        batch.append((key, value))
+        batch_chars += added_chars
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+_CHUNK_BOUNDARIES = (
+    re.compile(r'\n[ \t]*\n\s*'),           # Paragraphs
+    re.compile(r'\n\s*'),                    # Lines
+    re.compile(r'(?<=[.!?;:。！？])\s+'),     # Sentences
+    re.compile(r'\s+')                       # Words
+)
+
+
+def _split_long_text(text, max_chars):
+    """Split text longer than max_chars into chunks the provider accepts.
+    
+    Cuts are made at the last paragraph break inside the limit, falling back
+    to line, sentence and word boundaries and finally to a hard cut. A
+    boundary in the first half of the window is only used when nothing
+    better exists, so chunks stay close to the limit. The whitespace at each
+    cut is kept aside, since translators strip it from their responses.
+    
+    Args:
+        text: String to split
+        max_chars: Longest chunk allowed
+    
+    Returns:
+        Tuple of (chunks, gaps) with len(gaps) == len(chunks) + 1, such that
+        interleaving gaps[0], chunks[0], gaps[1], ... gives back text
+    """
+    start = len(text) - len(text.lstrip())
+    end = max(start, len(text.rstrip()))
+    gaps = [text[:start]]
+    chunks = []
+    while end - start > max_chars:
+        window = text[start:start + max_chars]
+        cut = max_chars  # Hard cut when there is no boundary at all
+        for min_length in (max_chars // 2, 1):
+            matches = None
+            for pattern in _CHUNK_BOUNDARIES:
+                matches = [m.start() for m in pattern.finditer(window) if m.start() >= min_length]
+                if matches:
+                    break
+            if matches:
+                cut = matches[-1]
+                break
+        chunk = window[:cut].rstrip()
+        chunks.append(chunk)
+        # Whitespace around the cut goes into the gap, even past the window
+        next_start = start + cut
+        while next_start < end and text[next_start].isspace():
+            next_start += 1
+        gaps.append(text[start + len(chunk):next_start])
+        start = next_start
+    chunks.append(text[start:end])
+    gaps.append(text[end:])
+    return chunks, gaps
+
+
+# How often engines waiting on a backoff check whether they were asked to stop
+STOP_POLL_INTERVAL = 0.1
+
+
+def _translate_pending(batches, translator, workers=1, progress_bar=None, verbose=False, retry_policy=None,
+                       stop_event=None):
+    """Translate batches of pending (key, value) pairs, yielding results as they complete.
+    
+    With workers > 1 the batches are dispatched to a bounded thread pool and
+    results are yielded in completion order, so callers must reassemble them
+    by key.
+    
+    Failed requests that should be retried go to a queue ordered by the time
+    their backoff ends, rather than sleeping in a worker, so other keys keep
+    flowing meanwhile. Requests whose backoff has ended are sent before new
+    ones; once the new ones run out, the queue is drained.
+    
+    Args:
+        batches: List of batches from _make_batches
+        translator: TranslatorBackend (or any object with translate(text))
+        workers: Number of concurrent translation requests
+        progress_bar: Optional tqdm progress bar
+        verbose: Whether to show verbose output
+        retry_policy: RetryPolicy shared by every request (default: RetryPolicy())
+        stop_event: Optional threading.Event; once set, no new requests are
+            sent and KeyboardInterrupt is raised after the in-flight ones
+            are yielded
+    
+    Yields:
+        Tuples of (key, translated_text, error)
+    """
+    import heapq
+    retry_policy = retry_policy or RetryPolicy()
+    fresh = collections.deque(_PendingRequest(batch) for batch in batches)
+    deferred = []  # Heap of (ready_at, sequence, request)
+    sequence = 0
+    
+    def schedule(follow_ups):
+        nonlocal sequence
+        for request in follow_ups:
+            heapq.heappush(deferred, (request.ready_at, sequence, request))
+            sequence += 1
+    
+    def next_request():
+        # Next request ready to send, or None if all remaining ones are backing off
+        if deferred and deferred[0][0] <= time.monotonic():
+            return heapq.heappop(deferred)[2]
+        if fresh:
+            return fresh.popleft()
+        return None
+    
+    def time_to_ready():
+        return max(0.0, deferred[0][0] - time.monotonic()) if deferred else None
+    
+    def stopped():
+        return stop_event is not None and stop_event.is_set()
+    
+    def pause(seconds):
+        # Wait for a deferred request, waking up early when asked to stop
+        if stop_event is None:
+            time.sleep(seconds)
+        else:
+            stop_event.wait(seconds)
+    
+    if workers <= 1:
+        while fresh or deferred:
+            if stopped():
+                raise KeyboardInterrupt
+            request = next_request()
+            if request is None:
+                pause(time_to_ready())
+                continue
+            results, follow_ups = _send_request(translator, request, retry_policy, progress_bar, verbose)
+            schedule(follow_ups)
+            yield from results
+        return
+    
+    # GoogleTranslator stores request parameters on the instance, so sharing one
+    # between threads would mix up concurrent requests. Each worker gets a copy.
+    local = threading.local()
+    
+    def work(request):
+        if not hasattr(local, 'translator'):
+            local.translator = copy.deepcopy(translator)
+        return _send_request(local.translator, request, retry_policy, progress_bar, verbose)
+    
+    executor = ThreadPoolExecutor(max_workers=workers)
+    in_flight = set()
+    try:
+        while fresh or deferred or in_flight:
+            while len(in_flight) < workers and not stopped():
+                request = next_request()
+                if request is None:
+                    break
+                in_flight.add(executor.submit(work, request))
+            if not in_flight:
+                if stopped():
+                    raise KeyboardInterrupt
+                pause(time_to_ready())
+                continue
+            # With every worker busy nothing can be sent before one finishes,
+            # so only wake up for a deferred request when a slot is free
+            timeout = time_to_ready() if len(in_flight) < workers and not stopped() else None
+            if timeout is not None and stop_event is not None:
+                timeout = min(timeout, STOP_POLL_INTERVAL)
+            done, in_flight = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                results, follow_ups = future.result()
+                schedule(follow_ups)
+                yield from results
+    finally:
+        # Drop queued work if we are interrupted (e.g. Ctrl+C)
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _parse_google_response(body):
+    """Extract the translated text from a Google Translate mobile page."""
+    match = _GOOGLE_RESULT_PATTERN.search(body)
+    if not match:
+        # Usually a consent or captcha page, so worth retrying
+        raise RuntimeError("No translation found in the response")
+    return html.unescape(re.sub(r'<[^>]+>', '', match.group(1))).strip()
+
+
+class HttpSessionPool:
+    """Keep-alive HTTP connection pool shared by every worker and target of a run.
+    
+    GoogleTranslator opens a new connection (and TLS handshake) for every
+    request. Requests sent through this pool reuse up to pool_size open
+    connections instead; callers block while all of them are busy.
+    
+    The session (and the requests import) is created on first use, so runs
+    that never send a request don't pay for it.
+    """
+    
+    def __init__(self, pool_size=10, timeout=30):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._session = None
+        self._lock = threading.Lock()
+    
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                try:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                except ImportError:
+                    raise ImportError("Pooled HTTP sessions require requests. Install it with: pip install requests")
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size, pool_block=True)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._session = session
+            return self._session
+    
+    def get(self, url, params=None):
+        return self.session.get(url, params=params, timeout=self.timeout)
+    
+    def post(self, url, json=None):
+        return self.session.post(url, json=json, timeout=self.timeout)
+    
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+
+class PooledGoogleTranslator:
+    """GoogleTranslator replacement that sends requests through an HttpSessionPool.
+    
+    Queries the same endpoint with the same parameters as GoogleTranslator.
+    It keeps no per-request state, so one instance is safely shared between
+    threads.
+    """
+    
+    def __init__(self, translator, pool):
+        # Language codes were already validated by GoogleTranslator
+        self.source = translator.source
+        self.target = translator.target
+        self.pool = pool
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def translate(self, text):
+        if len(text) > GOOGLE_MAX_CHARS:
+            raise ValueError(f"Text must be at most {GOOGLE_MAX_CHARS} characters, got {len(text)}")
+        text = text.strip()
+        if not text or self.source == self.target:
+            return text
+        params = {'tl': self.target, 'sl': self.source, 'q': text}
+        with self.pool.get(GOOGLE_TRANSLATE_URL, params) as response:
+            if response.status_code == 429:
+                raise RuntimeError("Too many requests (HTTP 429)")
+            response.raise_for_status()
+            return _parse_google_response(response.text)
+
+
+# Translator backends selectable with --backend, by name
+BACKENDS = {}
+
+
+def register_backend(cls):
+    """Class decorator adding a TranslatorBackend subclass to BACKENDS."""
+    BACKENDS[cls.name] = cls
+    return cls
+
+
+class TranslatorBackend:
+    """Interface for translation backends selectable with --backend.
+    
+    Backends translate one text per request with translate(). When
+    supports_batch is set the engines send batches through translate_batch(),
+    which by default packs them into a single newline-separated text.
+    Instances are deep-copied per worker thread, so backends holding shared
+    resources (sessions, pools) must copy them by reference.
+    
+    Attributes:
+        name: Registry name used with --backend
+        description: Label shown while initializing
+        max_chars: Longest text accepted in a single request
+        supports_batch: Whether several texts can be translated per request
+    """
+    
+    name = None
+    description = None
+    max_chars = GOOGLE_MAX_CHARS
+    supports_batch = True
+    
+    def __init__(self, source, target, **options):
+        self.source = source
+        self.target = target
+    
+    def translate(self, text):
+        raise NotImplementedError
+    
+    def translate_batch(self, texts):
+        """Translate a list of texts in one request, returning translations in the same order."""
+        return _translate_joined(self, texts)
+    
+    def async_backend(self, max_workers=None):
+        """Return an AsyncTranslatorBackend for the async engine."""
+        return ExecutorBackend(self, max_workers=max_workers)
+    
+    def supported_languages(self):
+        """Return a dict of language name -> code, or None if any code is accepted."""
+        return None
+
+
+@register_backend
+class GoogleBackend(TranslatorBackend):
+    """Google Translate through deep_translator (the default backend)."""
+    
+    name = 'google'
+    description = 'Google Translator'
+    
+    def __init__(self, source, target, http_pool=None, **options):
+        super().__init__(source, target)
+        from deep_translator import GoogleTranslator
+        try:
+            translator = GoogleTranslator(source=source, target=target)
+        except Exception as e:
+            error_msg = str(e)
+            if "-->" in error_msg:
+                error_msg = error_msg.split("-->", 1)[1].strip()
+            error_msg = error_msg.split('\n')[0].strip()
+            raise ValueError(f"{error_msg} Refer documentation for supported languages.")
+        if http_pool is not None:
+            translator = PooledGoogleTranslator(translator, http_pool)
+        self.translator = translator
+    
+    def translate(self, text):
+        return self.translator.translate(text)
+    
+    def supported_languages(self):
+        from deep_translator import GoogleTranslator
+        return GoogleTranslator(source='auto', target='en').get_supported_languages(as_dict=True)
+
+
+@register_backend
+class EchoBackend(TranslatorBackend):
+    """Offline backend returning every text unchanged, for benchmarks and CI."""
+    
+    name = 'echo'
+    description = 'echo backend'
+    max_chars = 1000000
+    
+    def translate(self, text):
+        return text
+
+
+@register_backend
+class PseudoBackend(EchoBackend):
+    """Offline pseudo-localization: accents letters and brackets each line.
+    
+    The output is deterministic and makes untranslated or truncated strings
+    easy to spot in the UI. Placeholders ({name}, {{count}}, %s, %(name)s),
+    HTML tags and entities are left untouched.
+    """
+    
+    name = 'pseudo'
+    description = 'pseudo-localization backend'
+    
+    ACCENTS = str.maketrans('AaCcEeIiNnOoUuYy', 'ÀàÇçÉéÎîÑñÖöÛûÝý')
+    PLACEHOLDER_PATTERN = re.compile(r'(\{\{.*?\}\}|\{[^{}]*\}|%\(\w+\)[sd]|%[sd]|<[^>]+>|&#?\w+;)')
+    
+    def translate(self, text):
+        lines = []
+        for line in text.split(BATCH_SEPARATOR):
+            if not line.strip():
+                lines.append(line)
+                continue
+            # Odd indices of the split are placeholders
+            parts = self.PLACEHOLDER_PATTERN.split(line)
+            lines.append('[' + ''.join(part if i % 2 else part.translate(self.ACCENTS)
+                                       for i, part in enumerate(parts)) + ']')
+        return BATCH_SEPARATOR.join(lines)
+
+
+@register_backend
+class LocalHttpBackend(TranslatorBackend):
+    """Backend for a LibreTranslate-compatible server (e.g. a local container).
+    
+    Sends POST {url}/translate with a JSON body {q, source, target, format}
+    and reads 'translatedText' from the response. Lists of texts are sent in
+    a single request by translate_batch().
+    """
+    
+    name = 'local-http'
+    description = 'local HTTP backend'
+    DEFAULT_URL = 'http://localhost:5000'
+    
+    def __init__(self, source, target, http_pool=None, url=None, api_key=None, **options):
+        super().__init__(source, target)
+        self.url = (url or self.DEFAULT_URL).rstrip('/')
+        self.api_key = api_key
+        self.http_pool = http_pool
+    
+    def __deepcopy__(self, memo):
+        # Holds no per-request state; copies share the connection pool
+        return self
+    
+    def _request(self, method, path, payload=None):
+        url = f"{self.url}{path}"
+        if self.http_pool is not None:
+            response = self.http_pool.post(url, payload) if method == 'POST' else self.http_pool.get(url)
+        else:
+            import requests
+            response = requests.request(method, url, json=payload, timeout=30)
+        with response:
+            if response.status_code == 429:
+                raise RuntimeError("Too many requests (HTTP 429)")
+            if response.status_code >= 400:
+                try:
+                    message = response.json().get('error')
+                except ValueError:
+                    message = None
+                raise RuntimeError(f"HTTP {response.status_code}: {message or response.reason}")
+            return response.json()
+    
+    def _translate(self, q):
+        payload = {'q': q, 'source': self.source, 'target': self.target, 'format': 'text'}
+        if self.api_key:
+            payload['api_key'] = self.api_key
+        return self._request('POST', '/translate', payload)['translatedText']
+    
+    def translate(self, text):
+        if not text.strip():
+            return text
+        return self._translate(text)
+    
+    def translate_batch(self, texts):
+        return self._translate(list(texts))
+    
+    def supported_languages(self):
+        return {language['name']: language['code'] for language in self._request('GET', '/languages')}
+
+
+def create_backend(name, source, target, **options):
+    """Instantiate the backend registered under name.
+    
+    Args:
+        name: Registry name (see BACKENDS)
+        source: Source language code
+        target: Target language code
+        **options: Backend options such as http_pool, url and api_key;
+            backends ignore options they don't use
+    
+    Returns:
+        TranslatorBackend instance
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}'. Available: {', '.join(sorted(BACKENDS))}")
+    if _daemon_cache is not None:
+        return _daemon_cache.backend(name, source, target, **options)
+    return BACKENDS[name](source, target, **options)
+
+
+class AsyncTranslatorBackend:
+    """Interface for backends used by the asyncio translation engine.
+    
+    Subclasses implement translate() as a coroutine returning the translated
+    text, and may override close() to release sessions or executors.
+    translate_batch() sends a newline-joined translate() request unless
+    overridden.
+    """
+    
+    async def translate(self, text):
+        raise NotImplementedError
+    
+    async def translate_batch(self, texts):
+        translated_text = await self.translate(BATCH_SEPARATOR.join(texts))
+        if translated_text is None:
+            return []
+        return [part.strip() for part in translated_text.split(BATCH_SEPARATOR)]
+    
+    async def close(self):
+        pass
+
+
+class ExecutorBackend(AsyncTranslatorBackend):
+    """Async backend that runs a synchronous translator in a thread pool.
+    
+    Used to drive the existing GoogleTranslator from the event loop.
+    """
+    
+    def __init__(self, translator, max_workers=None):
+        self.translator = translator
+        self.max_workers = max_workers
+        self._executor = None
+        self._local = threading.local()
+    
+    def _translator(self):
+        # Same per-thread copy as the thread engine (see _translate_pending)
+        if not hasattr(self._local, 'translator'):
+            self._local.translator = copy.deepcopy(self.translator)
+        return self._local.translator
+    
+    async def _run(self, function, *args):
+        if self._executor is None:
+            # Created on demand so the backend can be reused after close()
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+    
+    async def translate(self, text):
+        return await self._run(lambda: self._translator().translate(text))
+    
+    async def translate_batch(self, texts):
+        return await self._run(lambda: _translate_batch(self._translator(), texts))
+    
+    async def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class GoogleHttpBackend(AsyncTranslatorBackend):
+    """Native async backend for the Google Translate web endpoint (requires aiohttp).
+    
+    Queries the same mobile endpoint as GoogleTranslator, but over a single
+    aiohttp session so hundreds of requests can be in flight at once.
+    """
+    
+    BASE_URL = GOOGLE_TRANSLATE_URL
+    
+    def __init__(self, source, target, timeout=30):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("The 'http' async backend requires aiohttp. Install it with: pip install aiohttp")
+        self._aiohttp = aiohttp
+        self.source = source
+        self.target = target
+        self.timeout = timeout
+        self._session = None
+    
+    async def translate(self, text):
+        if not text.strip():
+            return text
+        if self._session is None:
+            # Sessions are bound to the running event loop, so create lazily
+            self._session = self._aiohttp.ClientSession(
+                timeout=self._aiohttp.ClientTimeout(total=self.timeout)
+            )
+        params = {'sl': self.source, 'tl': self.target, 'hl': self.target, 'q': text.strip()}
+        async with self._session.get(self.BASE_URL, params=params) as response:
+            if response.status == 429:
+                raise RuntimeError("Too many requests (HTTP 429)")
+            response.raise_for_status()
+            body = await response.text()
+        return _parse_google_response(body)
+    
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class RateLimitedBackend(AsyncTranslatorBackend):
+    """Async counterpart of RateLimitedTranslator."""
+    
+    def __init__(self, backend, limiter):
+        self.backend = backend
+        self.limiter = limiter
+    
+    async def _limited(self, text, send):
+        await self.limiter.acquire_async(len(text))
+        start = time.monotonic()
+        try:
+            result = await send()
+        except Exception as e:
+            self.limiter.release(time.monotonic() - start, e)
+            raise
+        self.limiter.release(time.monotonic() - start)
+        return result
+    
+    async def translate(self, text):
+        return await self._limited(text, lambda: self.backend.translate(text))
+    
+    async def translate_batch(self, texts):
+        return await self._limited(BATCH_SEPARATOR.join(texts), lambda: self.backend.translate_batch(texts))
+    
+    async def close(self):
+        await self.backend.close()
+
+
+class MeteredBackend(AsyncTranslatorBackend):
+    """Async counterpart of MeteredTranslator."""
+    
+    def __init__(self, backend, metrics):
+        self.backend = backend
+        self.metrics = metrics
+    
+    async def translate(self, text):
+        start = time.monotonic()
+        try:
+            result = await self.backend.translate(text)
+        except Exception as e:
+            self.metrics.record_request(text, time.monotonic() - start, error=e)
+            raise
+        self.metrics.record_request(text, time.monotonic() - start, result)
+        return result
+    
+    async def translate_batch(self, texts):
+        text = BATCH_SEPARATOR.join(texts)
+        start = time.monotonic()
+        try:
+            result = await self.backend.translate_batch(texts)
+        except Exception as e:
+            self.metrics.record_request(text, time.monotonic() - start, error=e)
+            raise
+        self.metrics.record_request(text, time.monotonic() - start, BATCH_SEPARATOR.join(result))
+        return result
+    
+    async def close(self):
+        await self.backend.close()
+
+
+async def _send_request_async(backend, request, retry_policy, progress_bar=None, verbose=False):
+    """Async counterpart of _send_request."""
+    if request.started is None:
+        request.started = retry_policy.start()
+    request.attempt += 1
+    token = _request_deadline.set(retry_policy.deadline_for(request.started))
+    try:
+        if len(request.batch) == 1:
+            translations = [await backend.translate(request.batch[0][1])]
+        else:
+            translations = await backend.translate_batch(request.texts)
+        error = None
+    except Exception as e:
+        translations, error = None, e
+    finally:
+        _request_deadline.reset(token)
+    return _handle_response(request, translations, error, retry_policy, progress_bar, verbose)
+
+
+async def _translate_pending_async(batches, backend, on_result, concurrency=100, progress_bar=None, verbose=False, retry_policy=None,
+                                   stop_event=None):
+    """Translate batches of pending (key, value) pairs on a single event loop.
+    
+    Args:
+        batches: List of batches from _make_batches
+        backend: AsyncTranslatorBackend instance
+        on_result: Callback invoked as on_result(key, translated_text, error)
+            for each pair as it completes
+        concurrency: Maximum number of in-flight requests
+        progress_bar: Optional tqdm progress bar
+        verbose: Whether to show verbose output
+        retry_policy: RetryPolicy shared by every request (default: RetryPolicy())
+        stop_event: Optional threading.Event; once set, requests not sent yet
+            are dropped and KeyboardInterrupt is raised when the in-flight
+            ones are done
+    """
+    import asyncio
+    retry_policy = retry_policy or RetryPolicy()
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    def stopped():
+        return stop_event is not None and stop_event.is_set()
+    
+    async def work(request):
+        # Back off outside the semaphore so other requests keep flowing
+        delay = request.ready_at - time.monotonic()
+        while delay > 0 and not stopped():
+            await asyncio.sleep(delay if stop_event is None else min(delay, STOP_POLL_INTERVAL))
+            delay = request.ready_at - time.monotonic()
+        async with semaphore:
+            if stopped():
+                return
+            results, follow_ups = await _send_request_async(backend, request, retry_policy, progress_bar, verbose)
+        for key, translated_text, error in results:
+            on_result(key, translated_text, error)
+        if follow_ups:
+            await asyncio.gather(*(work(follow_up) for follow_up in follow_ups))
+    
+    try:
+        await asyncio.gather(*(work(_PendingRequest(batch)) for batch in batches))
+    finally:
+        await backend.close()
+    if stopped():
+        raise KeyboardInterrupt
+
+
+def _default_cache_dir():
+    """Return the per-user cache directory for Intellator."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'intellator')
+
+
+def _throughput_path():
+    return os.path.join(_default_cache_dir(), 'throughput.json')
+
+
+def read_throughput_history():
+    """Return the throughput recorded for each backend by earlier runs, or {}."""
+    try:
+        history = read_json_file(_throughput_path())
+    except Exception:
+        return {}
+    return history if isinstance(history, dict) else {}
+
+
+# Serializes updates of the throughput history when targets run in parallel
+_THROUGHPUT_LOCK = threading.Lock()
+
+
+def record_throughput(backend, requests, seconds, concurrency):
+    """Fold the throughput of a finished translation into the history used by --plan.
+    
+    The measure kept is how long each request took with concurrency requests
+    in flight, backoff and throttling included, as a moving average that
+    favors recent runs. Runs with too few requests are ignored as noise.
+    
+    Args:
+        backend: Backend name
+        requests: Number of requests sent, retries included
+        seconds: Wall time spent translating
+        concurrency: Number of requests in flight (workers)
+    """
+    if requests < 10 or seconds <= 0:
+        return
+    sample = seconds * concurrency / requests
+    with _THROUGHPUT_LOCK:
+        history = read_throughput_history()
+        previous = history.get(backend)
+        if isinstance(previous, dict) and previous.get('seconds_per_request'):
+            sample = 0.7 * previous['seconds_per_request'] + 0.3 * sample
+        history[backend] = {'seconds_per_request': round(sample, 6), 'concurrency': concurrency, 'updated': time.time()}
+        try:
+            os.makedirs(_default_cache_dir(), exist_ok=True)
+            write_json_file(history, _throughput_path(), durable=False)
+        except (IOError, OSError):
+            pass  # The history only improves --plan estimates
+
+
+class TranslationMemory:
+    """SQLite-backed translation memory shared across runs, files and projects.
+    
+    Entries are keyed on (source language, target language, hash of the
+    normalized source text). When the number of entries exceeds max_entries
+    the least recently used ones are evicted.
+    """
+    
+    DEFAULT_PATH = os.path.join(_default_cache_dir(), 'memory.sqlite3')
+    DEFAULT_MAX_ENTRIES = 1000000
+    
+    def __init__(self, path=DEFAULT_PATH, max_entries=DEFAULT_MAX_ENTRIES):
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS memory ("
+                "source TEXT NOT NULL, target TEXT NOT NULL, text_hash TEXT NOT NULL, "
+                "translation TEXT NOT NULL, last_used REAL NOT NULL, "
+                "PRIMARY KEY (source, target, text_hash))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS memory_last_used ON memory (last_used)")
+        self._count = self._conn.execute("SELECT COUNT(*) FROM memory").fetchone()[0]
+    
+    @staticmethod
+    def normalize(text):
+        """Normalize source text the same way the translator sees it."""
+        return unicodedata.normalize('NFC', text).strip()
+    
+    @classmethod
+    def text_hash(cls, text):
+        return hashlib.sha256(cls.normalize(text).encode('utf-8')).hexdigest()
+    
+    def lookup_many(self, source, target, texts, touch=True):
+        """Look up translations for several source texts.
+        
+        Args:
+            source: Source language code
+            target: Target language code
+            texts: Source texts to look up
+            touch: Mark the entries found as recently used (False for dry runs)
+        
+        Returns:
+            Dict mapping each source text found in memory to its translation
+        """
+        hashes = {}
+        for text in texts:
+            hashes.setdefault(self.text_hash(text), []).append(text)
+        
+        found = {}
+        hits = []
+        with self._lock:
+            items = list(hashes)
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(items), 500):
+                chunk = items[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, translation FROM memory "
+                    f"WHERE source = ? AND target = ? AND text_hash IN ({placeholders})",
+                    [source, target] + chunk
+                )
+                for text_hash, translation in rows:
+                    hits.append(text_hash)
+                    for text in hashes[text_hash]:
+                        found[text] = translation
+            if hits and touch:
+                # Touch entries so eviction keeps recently used translations
+                now = time.time()
+                with self._conn:
+                    self._conn.executemany(
+                        "UPDATE memory SET last_used = ? WHERE source = ? AND target = ? AND text_hash = ?",
+                        [(now, source, target, text_hash) for text_hash in hits]
+                    )
+        return found
+    
+    def store_many(self, source, target, pairs):
+        """Store (source_text, translation) pairs, evicting old entries if needed."""
+        if not pairs:
+            return
+        now = time.time()
+        rows = [(source, target, self.text_hash(text), translation, now) for text, translation in pairs]
+        with self._lock:
+            with self._conn:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO memory (source, target, text_hash, translation, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._count += self._conn.total_changes - before
+                self._conn.executemany(
+                    "UPDATE memory SET translation = ?, last_used = ? "
+                    "WHERE source = ? AND target = ? AND text_hash = ?",
+                    [(translation, now, src, tgt, text_hash) for src, tgt, text_hash, translation, now in rows]
+                )
+                if self._count > self.max_entries:
+                    self._conn.execute(
+                        "DELETE FROM memory WHERE rowid IN "
+                        "(SELECT rowid FROM memory ORDER BY last_used LIMIT ?)",
+                        (self._count - self.max_entries,)
+                    )
+                    self._count = self.max_entries
+    
+    def pair(self, source, target):
+        """Return a view of the memory bound to one language pair."""
+        return _LanguagePairMemory(self, source, target)
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class _LanguagePairMemory:
+    """TranslationMemory view for a single (source, target) pair, as used by translate_json."""
+    
+    def __init__(self, memory, source, target):
+        self.memory = memory
+        self.source = source
+        self.target = target
+    
+    def lookup_many(self, texts, touch=True):
+        return self.memory.lookup_many(self.source, self.target, texts, touch)
+    
+    def store_many(self, pairs):
+        self.memory.store_many(self.source, self.target, pairs)
+
+
+def format_path(path):
+    """Render a path tuple from flatten_json as a key such as 'auth.login.title' or 'items[3]'.
+    
+    Top-level keys are rendered unchanged, so flat files keep their key names.
+    In deeper paths, '.', '[' and '\\' inside object keys are escaped with '\\'.
+    """
+    if len(path) == 1 and isinstance(path[0], str):
+        return path[0]
+    parts = []
+    for part in path:
+        if isinstance(part, int):
+            parts.append(f"[{part}]")
+        else:
+            escaped = part.replace('\\', '\\\\').replace('.', '\\.').replace('[', '\\[')
+            parts.append(f".{escaped}" if parts else escaped)
+    return ''.join(parts)
+
+
+def flatten_json(data):
+    """Flatten nested objects and arrays into an ordered path index.
+    
+    Every string, number, boolean, null and empty container becomes one entry
+    keyed by its rendered path (see format_path), in document order.
+    
+    Args:
+        data: Parsed JSON object
+    
+    Returns:
+        Tuple of (flat dict mapping rendered paths to leaf values,
+        dict mapping rendered paths to path tuples for unflatten_json)
+    """
+    flat = {}
+    paths = {}
+    
+    def visit(path, value):
+        if isinstance(value, dict) and value:
+            for key, child in value.items():
+                visit(path + (key,), child)
+        elif isinstance(value, list) and value:
+            for index, child in enumerate(value):
+                visit(path + (index,), child)
+        else:
+            name = format_path(path)
+            if name in flat:
+                raise ValueError(f"Error: Key path '{name}' is ambiguous in nested mode. Rename the key or run without --nested.")
+            flat[name] = value
+            paths[name] = path
+    
+    for key, value in data.items():
+        visit((key,), value)
+    return flat, paths
+
+
+def _count_leaves(value):
+    """Count the entries flatten_json would produce for a value."""
+    if isinstance(value, dict) and value:
+        return sum(_count_leaves(child) for child in value.values())
+    if isinstance(value, list) and value:
+        return sum(_count_leaves(child) for child in value)
+    return 1
+
+
+def unflatten_json(flat, paths):
+    """Rebuild the nested structure of a flattened object, in its original order.
+    
+    Args:
+        flat: Dict mapping rendered paths to leaf values, in document order
+        paths: Dict mapping rendered paths to path tuples (from flatten_json)
+    
+    Returns:
+        Nested dict
+    """
+    result = {}
+    for name, value in flat.items():
+        path = paths[name]
+        node = result
+        for part, next_part in zip(path, path[1:]):
+            if isinstance(node, list):
+                if part == len(node):
+                    node.append([] if isinstance(next_part, int) else {})
+                node = node[part]
+            else:
+                if part not in node:
+                    node[part] = [] if isinstance(next_part, int) else {}
+                node = node[part]
+        if isinstance(node, list):
+            node.append(value)
+        else:
+            node[path[-1]] = value
+    return result
+
+
+def needs_reorganization(data, existing_translations):
+    """Check whether keys shared with the parent are in a different order in the existing translations.
+    
+    Runs in O(n): the keys common to both files are in parent order exactly
+    when their positions in the parent strictly increase while walking the
+    existing translations.
+    
+    Args:
+        data: The parent JSON data
+        existing_translations: Already translated data from output file
+    
+    Returns:
+        True if the output file has to be reorganized to match the parent
+    """
+    position = {key: index for index, key in enumerate(data)}
+    last = -1
+    for key in existing_translations:
+        index = position.get(key)
+        if index is None:
+            continue
+        if index < last:
+            return True
+        last = index
+    return False
+
+
+def needs_translation(data, existing_translations, source_hashes=None, nested=False):
+    """Check whether any string value lacks an up-to-date existing translation.
+    
+    Applies the same skip rules as translate_json without touching a
+    translator, so callers can avoid initializing one.
+    
+    Args:
+        data: The parent JSON data
+        existing_translations: Already translated data from output file
+        source_hashes: Optional source hashes from the lock file
+        nested: Whether nested objects and arrays are translated
+    
+    Returns:
+        True if at least one value would be sent to the translator
+    """
+    if nested:
+        data = flatten_json(data)[0]
+        existing_translations = flatten_json(existing_translations)[0] if existing_translations else {}
+    for key, value in data.items():
+        if not isinstance(value, str):
+            continue
+        if key not in existing_translations:
+            return True
+        if source_hashes is not None and source_hashes.get(key) != _source_hash(value):
+            return True
+    return False
+
+
+def _collect_pending(data, existing_translations, current_hashes, source_hashes=None, progress_bar=None, verbose=False):
+    """Find the values translate_json has to translate, skipping the rest.
+    
+    Existing translations are reused unless their source value changed since
+    the lock file was written; non-string values are kept as-is.
+    
+    Args:
+        data: Flat parent data
+        existing_translations: Flat existing translations
+        current_hashes: Source hashes of data (only read when source_hashes is given)
+        source_hashes: Optional source hashes from the lock file
+        progress_bar: Optional tqdm progress bar, advanced for skipped keys
+        verbose: Whether to show verbose output
+    
+    Returns:
+        Tuple of (changed_keys, pending) where pending is a list of
+        (key, value) pairs in parent order
+    """
+    changed_keys = []
+    if source_hashes is not None:
+        changed_keys = [key for key in data
+                        if key in existing_translations and source_hashes.get(key) != current_hashes[key]]
+    stale = set(changed_keys)
+    
+    # Collect string values that still need translating
+    pending = []
+    for key, value in data.items():
+        if key in existing_translations and key not in stale:
+            # Existing translation will be reused
+            if progress_bar is not None:
+                progress_bar.update(1)
+                if verbose:
+                    progress_bar.set_postfix_str(f"Skipped: {key[:30]}..." if len(key) > 30 else f"Skipped: {key}")
+        elif isinstance(value, str):
+            pending.append((key, value))
+        elif progress_bar is not None:
+            # Non-string values are kept as-is
+            progress_bar.update(1)
+    
+    return changed_keys, pending
+
+
+def _deduplicate_pending(pending):
+    """Group pending (key, value) pairs by value.
+    
+    Returns:
+        Tuple of (unique, duplicates): the first (key, value) pair of each
+        distinct value, and a dict mapping that key to every key sharing it
+    """
+    duplicates = {}
+    first_key_for = {}
+    unique = []
+    for key, value in pending:
+        if value in first_key_for:
+            duplicates[first_key_for[value]].append(key)
+        else:
+            first_key_for[value] = key
+            duplicates[key] = [key]
+            unique.append((key, value))
+    return unique, duplicates
+
+
+def _split_oversized(unique, max_chars):
+    """Replace values longer than max_chars with their chunks (see _split_long_text).
+    
+    Returns:
+        Tuple of (requests, chunk_owner, chunk_parts): the (key, text) pairs to
+        send, a dict mapping each chunk key to (value key, chunk index), and
+        the reassembly state of every chunked value
+    """
+    keys = {key for key, _ in unique}
+    chunk_owner = {}
+    chunk_parts = {}
+    requests = []
+    for key, value in unique:
+        if len(value) <= max_chars:
+            requests.append((key, value))
+            continue
+        chunks, gaps = _split_long_text(value, max_chars)
+        chunk_parts[key] = {'gaps': gaps, 'texts': [None] * len(chunks), 'missing': len(chunks)}
+        for index, chunk in enumerate(chunks):
+            chunk_key = f"{key}#{index + 1}"
+            while chunk_key in keys or chunk_key in chunk_owner:
+                chunk_key += '#'
+            chunk_owner[chunk_key] = (key, index)
+            requests.append((chunk_key, chunk))
+    return requests, chunk_owner, chunk_parts
+
+
+def plan_translation(data, existing_translations, source_hashes=None, memory=None, batch_size=1,
+                     batch_chars=GOOGLE_MAX_CHARS, max_chars=GOOGLE_MAX_CHARS, nested=False, current_hashes=None):
+    """Work out what translate_json would send for a target, without sending anything.
+    
+    Runs the same skip, translation memory, deduplication, chunking and
+    batching steps as translate_json. Memory entries are only read, not
+    marked as used.
+    
+    Args:
+        data: The parent JSON data
+        existing_translations: Already translated data from the output file
+        source_hashes: Optional source hashes from the lock file
+        memory: Optional translation memory for this language pair
+        batch_size: Maximum number of values packed into one request
+        batch_chars: Character limit for a single batched request
+        max_chars: Provider character limit for a single request
+        nested: Whether strings inside nested objects and arrays are translated
+        current_hashes: Optional precomputed source hashes of the (flattened)
+            data, so planning many targets hashes the parent file only once
+    
+    Returns:
+        Dict with total_keys, to_translate, changed, memory_hits, unique,
+        characters and requests
+    """
+    if nested:
+        data = flatten_json(data)[0]
+        existing_translations = flatten_json(existing_translations)[0] if existing_translations else {}
+    if source_hashes is not None and current_hashes is None:
+        current_hashes = {key: _source_hash(value) for key, value in data.items()}
+    changed_keys, pending = _collect_pending(data, existing_translations, current_hashes, source_hashes)
+    to_translate = len(pending)
+    
+    if memory is not None and pending:
+        remembered = memory.lookup_many([value for _, value in pending], touch=False)
+        if remembered:
+            pending = [(key, value) for key, value in pending if value not in remembered]
+    
+    unique, _ = _deduplicate_pending(pending)
+    requests, _, _ = _split_oversized(unique, max_chars)
+    return {
+        'total_keys': len(data),
+        'to_translate': to_translate,
+        'changed': len(changed_keys),
+        'memory_hits': to_translate - len(pending),
+        'unique': len(unique),
+        'characters': sum(len(value) for _, value in unique),
+        'requests': len(_make_batches(requests, batch_size, batch_chars))
+    }
+
+
+def translate_json(data, existing_translations, translator, progress_bar=None, verbose=False, max_retries=3, workers=1, engine='thread',
+                   batch_size=1, batch_chars=GOOGLE_MAX_CHARS, max_chars=GOOGLE_MAX_CHARS, memory=None, source_hashes=None,
+                   limiter=None, checkpoint=None, checkpoint_every=500, checkpoint_interval=60, final_checkpoint=False, resumed=None, nested=False, metrics=None,
+                   retry_policy=None, stop_event=None):
+    """Translate JSON values, maintaining the same structure and order as parent.
+    
+    Args:
+        data: The parent JSON data to translate
+        existing_translations: Already translated data from output file (if exists)
+        translator: TranslatorBackend (or any object with translate(text)),
+            or an AsyncTranslatorBackend when using the async engine
+        progress_bar: Optional tqdm progress bar
+        verbose: Whether to show verbose output
+        max_retries: Maximum number of attempts per request, used when no
+            retry_policy is given
+        workers: Number of concurrent translation requests (1 = serial)
+        engine: 'thread' for the thread-pool engine or 'async' for the
+            asyncio engine (workers then limits in-flight requests)
+        batch_size: Maximum number of values packed into one request (1 = no batching)
+        batch_chars: Character limit for a single batched request
+        max_chars: Provider character limit for a single request. Longer
+            values are split at paragraph or sentence boundaries, their
+            chunks translated concurrently and joined back in order.
+        memory: Optional translation memory for this language pair (see
+            TranslationMemory.pair), consulted before calling the translator
+        source_hashes: Optional source hashes from the lock file of a previous
+            run. Existing translations whose source value changed since then
+            (or that were never recorded) are translated again.
+        limiter: Optional RateLimiter shared by all workers and targets
+        checkpoint: Optional callback invoked as checkpoint(entries) with the
+            (key, translation, source hash) tuples finished since the previous
+            call, every checkpoint_every keys or checkpoint_interval seconds
+            and when translation is interrupted
+        checkpoint_every: Number of translated keys between checkpoints (0 = off)
+        checkpoint_interval: Seconds between checkpoints (0 = off)
+        final_checkpoint: Also checkpoint when translation finishes, for
+            callers that don't write the output right away
+        resumed: Optional dict of key -> (translation, source hash) checkpointed
+            by an interrupted run (see read_journal), used like existing
+            translations recorded in the lock file
+        nested: Whether to translate strings inside nested objects and arrays.
+            They are flattened into a path index (e.g. 'auth.login.title',
+            'items[3]'), translated like top-level values and rebuilt with the
+            original structure. Stats and source hashes are keyed by path.
+        metrics: Optional TargetMetrics receiving plan/translate timings and
+            per-request counters
+        retry_policy: Optional RetryPolicy deciding which failed requests are
+            retried (default: RetryPolicy(max_retries) reporting to metrics)
+        stop_event: Optional threading.Event that interrupts translation like
+            Ctrl+C (checkpointing what finished) once set
+    
+    Returns:
+        Tuple of (translated_data dict, stats dict)
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Error: Input data must be a dictionary.")
+    
+    plan_start = time.perf_counter()
+    
+    if nested:
+        data, paths = flatten_json(data)
+        existing_translations = flatten_json(existing_translations)[0] if existing_translations else {}
+    
+    translated_data = {}
+    total_items = len(data)
+    
+    if total_items == 0:
+        print("Warning: No translation keys found in the JSON file.")
+        return data, {}
+    
+    # Track detailed statistics
+    skipped_keys = []
+    translated_keys = []
+    failed_keys = []
+    reorganized = False
+    
+    # Detect if reorganization is needed
+    if existing_translations:
+        reorganized = needs_reorganization(data, existing_translations)
+    
+    # Hash source values to detect edits since the previous run
+    current_hashes = {key: _source_hash(value) for key, value in data.items()}
+    
+    # Checkpointed translations count as existing ones, checked against their
+    # own source hashes; without a lock file the others are trusted as before
+    if resumed:
+        existing_translations = dict(existing_translations)
+        if source_hashes is None:
+            source_hashes = {key: current_hashes.get(key) for key in existing_translations}
+        else:
+            source_hashes = dict(source_hashes)
+        for key, (translation, source_hash) in resumed.items():
+            existing_translations[key] = translation
+            source_hashes[key] = source_hash
+    changed_keys, pending = _collect_pending(data, existing_translations, current_hashes, source_hashes,
+                                             progress_bar, verbose)
+    stale = set(changed_keys)
+    
+    results = {}
+    memory_keys = []
+    
+    # Reuse translations of the same text from the translation memory
+    if memory is not None and pending:
+        remembered = memory.lookup_many([value for _, value in pending])
+        if remembered:
+            remaining = []
+            for key, value in pending:
+                if value in remembered:
+                    results[key] = remembered[value]
+                    memory_keys.append(key)
+                    if progress_bar is not None:
+                        progress_bar.update(1)
+                else:
+                    remaining.append((key, value))
+            pending = remaining
+    
+    # Translate each distinct value once, on behalf of every key that uses it
+    unique, duplicates = _deduplicate_pending(pending)
+    unique_values = dict(unique)
+    
+    # Values over the provider limit are translated as chunks, each a
+    # request of its own that can run alongside the rest
+    requests, chunk_owner, chunk_parts = _split_oversized(unique, max_chars)
+    
+    # Translate pending values (concurrently when workers > 1)
+    batches = _make_batches(requests, batch_size, batch_chars)
+    finished = []
+    remembered = 0
+    checkpoint_keys = list(memory_keys)
+    checkpointed = 0
+    since_checkpoint = 0
+    last_checkpoint = time.monotonic()
+    
+    def remember():
+        # Store translations finished since the last call in the memory
+        nonlocal remembered
+        if memory is not None and len(finished) > remembered:
+            memory.store_many([(unique_values[key], results[key]) for key in finished[remembered:]])
+            remembered = len(finished)
+    
+    def save_checkpoint():
+        # Only keys finished since the last checkpoint; failed keys are left
+        # out so a resumed run retries them
+        nonlocal checkpointed, since_checkpoint, last_checkpoint
+        if len(checkpoint_keys) > checkpointed:
+            checkpoint([(key, results[key], current_hashes[key]) for key in checkpoint_keys[checkpointed:]])
+            checkpointed = len(checkpoint_keys)
+        remember()
+        since_checkpoint = 0
+        last_checkpoint = time.monotonic()
+    
+    def record_request(key, translated_text, error):
+        if key not in chunk_owner:
+            record(key, translated_text, error)
+            return
+        # Reassemble chunked values once their last chunk is back
+        key, index = chunk_owner[key]
+        parts = chunk_parts[key]
+        if parts['missing'] == 0:
+            return  # Already recorded as failed
+        if translated_text is None:
+            parts['missing'] = 0
+            record(key, None, error)
+            return
+        parts['texts'][index] = translated_text
+        parts['missing'] -= 1
+        if parts['missing'] == 0:
+            gaps = parts['gaps']
+            record(key, gaps[0] + ''.join(text + gap for text, gap in zip(parts['texts'], gaps[1:])), None)
+    
+    def record(key, translated_text, error):
+        nonlocal since_checkpoint
+        keys = duplicates[key]
+        for duplicate_key in keys:
+            results[duplicate_key] = translated_text
+        if translated_text is None and verbose:
+            print(f"\nWarning: Failed to translate '{key}' ({classify_error(error)} error): {error}")
+        if translated_text is not None:
+            finished.append(key)
+            checkpoint_keys.extend(keys)
+        
+        # Update progress bar
+        if progress_bar is not None:
+            progress_bar.update(len(keys))
+            if verbose and translated_text is not None:
+                progress_bar.set_postfix_str(f"Translated: {key[:30]}..." if len(key) > 30 else f"Translated: {key}")
+        
+        # Periodically flush progress so an interrupted run can resume
+        if checkpoint is not None:
+            since_checkpoint += len(keys)
+            if ((checkpoint_every and since_checkpoint >= checkpoint_every)
+                    or (checkpoint_interval and time.monotonic() - last_checkpoint >= checkpoint_interval)):
+                save_checkpoint()
+    
+    if retry_policy is None:
+        retry_policy = RetryPolicy(max_attempts=max_retries, metrics=metrics)
+    
+    translate_start = time.perf_counter()
+    if metrics is not None:
+        metrics.add_time('plan', translate_start - plan_start)
+    
+    # Requests sent (retries and per-key fallbacks included) are counted even
+    # without metrics, for the throughput history used by --plan
+    request_metrics = metrics if metrics is not None else TargetMetrics(None, None)
+    requests_before = request_metrics.requests
+    
+    try:
+        if engine == 'async':
+            backend = translator
+            if not isinstance(backend, AsyncTranslatorBackend):
+                backend = ExecutorBackend(translator, max_workers=workers)
+            backend = MeteredBackend(backend, request_metrics)
+            if limiter is not None:
+                backend = RateLimitedBackend(backend, limiter)
+            import asyncio
+            asyncio.run(_translate_pending_async(batches, backend, record_request, workers, progress_bar, verbose,
+                                                 retry_policy, stop_event))
+        else:
+            translator = MeteredTranslator(translator, request_metrics)
+            if limiter is not None:
+                translator = RateLimitedTranslator(translator, limiter)
+            for key, translated_text, error in _translate_pending(batches, translator, workers, progress_bar, verbose,
+                                                                  retry_policy, stop_event):
+                record_request(key, translated_text, error)
+    except BaseException:
+        # Keep everything finished so far (Ctrl+C, crashes) before giving up
+        if checkpoint is not None:
+            save_checkpoint()
+        else:
+            remember()
+        if metrics is not None:
+            metrics.add_time('translate', time.perf_counter() - translate_start)
+        raise
+    
+    # Remember new translations for future runs
+    if checkpoint is not None and final_checkpoint:
+        save_checkpoint()
+    else:
+        remember()
+    if metrics is not None:
+        metrics.add_time('translate', time.perf_counter() - translate_start)
+    
+    # Assemble output in parent file order
+    for key, value in data.items():
+        if key in existing_translations and key not in stale:
+            # Use existing translation
+            translated_data[key] = existing_translations[key]
+            skipped_keys.append(key)
+        elif key in results:
+            if results[key] is None:
+                failed_keys.append(key)
+                # Keep original value if all retries fail
+                translated_data[key] = value
+            else:
+                translated_data[key] = results[key]
+                translated_keys.append(key)
+        else:
+            # Keep non-string values as-is
+            translated_data[key] = value
+    
+    # Create statistics dictionary
+    failed = set(failed_keys)
+    stats = {
+        'total_keys': total_items,
+        'reorganized': reorganized,
+        'skipped': {
+            'count': len(skipped_keys),
+            'keys': skipped_keys
+        },
+        'translated': {
+            'count': len(translated_keys),
+            'keys': translated_keys
+        },
+        'failed': {
+            'count': len(failed_keys),
+            'keys': failed_keys
+        },
+        'memory_hits': len(memory_keys),
+        'deduplicated': len(pending) - len(unique),
+        'requests': request_metrics.requests - requests_before,
+        'changed': {
+            'count': len(changed_keys),
+            'keys': changed_keys
+        },
+        # Failed keys are left out so the next run retries them
+        'source_hashes': {key: current_hashes[key] for key in translated_data if key not in failed}
+    }
+    
+    if nested:
+        translated_data = unflatten_json(translated_data, paths)
+    
+    return translated_data, stats
+
+
+def translate_json_stream(input_path, output_path, existing_index, hash_index, translator, source_lang,
+                          progress_bar=None, verbose=False, window=1000, durable=True, journal_index=None, **options):
+    """Translate a JSON object file window by window without loading it whole.
+    
+    Top-level members are parsed incrementally, translated a window at a time
+    through translate_json and written to the output as soon as each window is
+    done, in parent order. Memory use is bounded by the window size rather
+    than the file size.
+    
+    Args:
+        input_path: Parent JSON file to translate
+        output_path: Output JSON file (its lock file is written alongside)
+        existing_index: _DiskIndex of existing translations, or None
+        hash_index: _DiskIndex of source hashes from the lock file, or None
+        translator: Translator or async backend, as for translate_json
+        source_lang: Source language code recorded in the lock file
+        progress_bar: Optional tqdm progress bar
+        verbose: Whether to show verbose output
+        window: Number of keys translated together
+        durable: Whether to fsync output files (see write_json_file)
+        journal_index: _DiskIndex of translations checkpointed by an
+            interrupted run (see _index_journal), or None
+        **options: Further keyword arguments passed to translate_json,
+            including its checkpoint options
+    
+    Returns:
+        Stats dict like translate_json's, with key lists capped for display
+        (failed keys are kept in full)
+    """
+    display_limit = 10
+    totals = {
+        'total_keys': 0,
+        'reorganized': False,
+        'skipped': {'count': 0, 'keys': []},
+        'translated': {'count': 0, 'keys': []},
+        'failed': {'count': 0, 'keys': []},
+        'memory_hits': 0,
+        'deduplicated': 0,
+        'requests': 0,
+        'changed': {'count': 0, 'keys': []}
+    }
+    # Position in the existing output of the last key seen in both files
+    last_position = -1
+    
+    def windows():
+        batch = {}
+        for key, value in iter_json_items(input_path):
+            batch[key] = value
+            if len(batch) >= window:
+                yield batch
+                batch = {}
+        if batch:
+            yield batch
+    
+    with StreamingJsonWriter(output_path, durable) as writer, \
+            StreamingJsonWriter(lock_file_path(output_path), durable) as lock_writer:
+        lock_writer.write('source', source_lang)
+        lock_writer.begin_object('source_hashes')
+        
+        for data in windows():
+            existing = existing_index.get_many(data) if existing_index is not None else {}
+            # Nested mode records hashes and checkpoints per leaf path rather than per top-level key
+            leaf_keys = flatten_json(data)[0] if options.get('nested') else data
+            source_hashes = hash_index.get_many(leaf_keys) if hash_index is not None else None
+            resumed = journal_index.get_many(leaf_keys) if journal_index is not None else None
+            translated_data, stats = translate_json(data, existing, translator, progress_bar, verbose,
+                                                    source_hashes=source_hashes, resumed=resumed,
+                                                    final_checkpoint=True, **options)
+            
+            # Same check as needs_reorganization, one window at a time
+            if existing and not totals['reorganized']:
+                positions = existing_index.positions(existing)
+                for key in data:
+                    position = positions.get(key)
+                    if position is None:
+                        continue
+                    if position < last_position:
+                        totals['reorganized'] = True
+                        break
+                    last_position = position
+            for key, value in translated_data.items():
+                writer.write(key, value)
+            for key, source_hash in stats['source_hashes'].items():
+                lock_writer.write(key, source_hash)
+            
+            # Accumulate statistics across windows
+            totals['total_keys'] += stats['total_keys']
+            totals['memory_hits'] += stats['memory_hits']
+            totals['deduplicated'] += stats['deduplicated']
+            totals['requests'] += stats['requests']
+            for name in ('skipped', 'translated', 'changed'):
+                totals[name]['count'] += stats[name]['count']
+                room = display_limit - len(totals[name]['keys'])
+                totals[name]['keys'].extend(stats[name]['keys'][:max(room, 0)])
+            totals['failed']['count'] += stats['failed']['count']
+            totals['failed']['keys'].extend(stats['failed']['keys'])
+    
+    return totals
+
+
+# The process umask, read once at import: os.umask can only be read by
+# changing it, which would race with worker threads and the daemon
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _create_temp_file(file_path):
+    """Create a temporary file next to file_path for an atomic replace.
+    
+    Returns:
+        Tuple of (file descriptor, temporary path)
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    return tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix='.tmp')
+
+
+def _commit_temp_file(temp_path, file_path, durable=True):
+    """Atomically move a fully written temporary file over file_path."""
+    # mkstemp creates private files; keep the permissions a plain open() would give
+    try:
+        mode = os.stat(file_path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    os.chmod(temp_path, mode)
+    
+    os.replace(temp_path, file_path)
+    if durable:
+        _fsync_directory(os.path.dirname(os.path.abspath(file_path)))
+
+
+def write_json_file(data, file_path, durable=True):
+    """Write JSON data to file with proper formatting.
+    
+    The data is written to a temporary file in the same directory which then
+    atomically replaces the target, so an interrupted write never leaves a
+    truncated file behind.
+    
+    Args:
+        data: JSON-serializable data
+        file_path: Destination path
+        durable: Whether to fsync the file and directory before returning.
+            Turning this off is faster but a power loss may lose the write.
+    """
+    _write_file_atomically(file_path, lambda f: json.dump(data, f, ensure_ascii=False, indent=2), durable)
+
+
+def _write_file_atomically(file_path, write, durable=True):
+    """Write a text file through a temporary file and an atomic replace.
+    
+    Args:
+        file_path: Destination path
+        write: Callable receiving the open temporary file
+        durable: Whether to fsync the file and directory before returning
+    """
+    temp_path = None
+    try:
+        fd, temp_path = _create_temp_file(file_path)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            write(f)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        _commit_temp_file(temp_path, file_path, durable)
+        temp_path = None
+    except Exception as e:
+        raise IOError(f"Error writing to {file_path}: {e}")
+    finally:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def format_prometheus_metrics(run):
+    """Render run metrics in the Prometheus text format.
+    
+    The output is meant for the node_exporter textfile collector; every value
+    describes the last run, so counters are exported as gauges.
+    
+    Args:
+        run: Run metrics dict as written by --metrics-json
+    
+    Returns:
+        The exposition text
+    """
+    lines = []
+    
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP intellator_{name} {help_text}")
+        lines.append(f"# TYPE intellator_{name} {kind}")
+        for suffix, labels, value in samples:
+            label_text = ','.join(
+                '{}="{}"'.format(label, str(text).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+                for label, text in labels.items()
+            )
+            lines.append(f"intellator_{name}{suffix}{{{label_text}}} {value}" if label_text
+                         else f"intellator_{name}{suffix} {value}")
+    
+    targets = run['targets']
+    pair = [(target, {'source': target['source'], 'target': target['target']}) for target in targets]
+    
+    metric('run_timestamp_seconds', 'gauge', 'Unix time the last run started.',
+           [('', {}, run['timestamp'])])
+    metric('run_duration_seconds', 'gauge', 'Wall time of the last run.',
+           [('', {}, run['wall_time'])])
+    metric('phase_seconds', 'gauge', 'Wall time spent in each phase of the last run.',
+           [('', {'phase': phase}, seconds) for phase, seconds in run['phases'].items()]
+           + [('', dict(labels, phase=phase), seconds)
+              for target, labels in pair for phase, seconds in target['phases'].items()])
+    metric('target_success', 'gauge', 'Whether the target language finished without errors.',
+           [('', labels, int(target['success'])) for target, labels in pair])
+    metric('keys', 'gauge', 'Keys by outcome in the last run.',
+           [('', dict(labels, status=status), count)
+            for target, labels in pair for status, count in target['keys'].items()])
+    for name, field, help_text in (('requests', 'count', 'Translation requests sent.'),
+                                   ('request_errors', 'errors', 'Translation requests that failed.'),
+                                   ('request_throttled', 'throttled', 'Translation requests rejected with HTTP 429.'),
+                                   ('request_retries', 'retries', 'Translation requests repeating a failed request.')):
+        metric(name, 'gauge', help_text,
+               [('', labels, target['requests'][field]) for target, labels in pair])
+    metric('retry_decisions', 'gauge', 'Retry policy decisions for failed requests, by reason.',
+           [('', dict(labels, decision=decision, reason=reason), count)
+            for target, labels in pair for decision in ('retry', 'give_up')
+            for reason, count in target['retry_policy'][decision].items()])
+    metric('retry_wait_seconds', 'gauge', 'Backoff time scheduled by the retry policy.',
+           [('', labels, target['retry_policy']['wait_seconds']) for target, labels in pair])
+    for name, help_text in (('chars_sent', 'Characters sent to the translator.'),
+                            ('bytes_sent', 'UTF-8 bytes of text sent to the translator.'),
+                            ('chars_received', 'Characters of translated text received.')):
+        metric(name, 'gauge', help_text, [('', labels, target[name]) for target, labels in pair])
+    
+    samples = []
+    for target, labels in pair:
+        latency = target['latency']
+        samples.extend(('_bucket', dict(labels, le=bound), count) for bound, count in latency['buckets'].items())
+        samples.append(('_sum', labels, latency['sum']))
+        samples.append(('_count', labels, latency['count']))
+    metric('request_latency_seconds', 'histogram', 'Translation request latency.', samples)
+    
+    return '\n'.join(lines) + '\n'
+
+
+class StreamingJsonWriter:
+    """Write a JSON object member by member, formatted like write_json_file.
+    
+    Entries go to a temporary file that atomically replaces the target on
+    commit(), so memory use doesn't grow with the size of the output. Used as
+    a context manager, the file is committed on success and discarded if an
+    exception is raised.
+    """
+    
+    def __init__(self, file_path, durable=True):
+        self.file_path = file_path
+        self.durable = durable
+        try:
+            fd, self._temp_path = _create_temp_file(file_path)
+        except OSError as e:
+            raise IOError(f"Error writing to {file_path}: {e}")
+        self._file = os.fdopen(fd, 'w', encoding='utf-8')
+        self._file.write('{')
+        # One flag per open object: whether it has no members yet
+        self._empty = [True]
+    
+    def _start_member(self, key):
+        indent = '  ' * len(self._empty)
+        separator = '' if self._empty[-1] else ','
+        self._empty[-1] = False
+        self._file.write(f"{separator}\n{indent}{json.dumps(key, ensure_ascii=False)}: ")
+        return indent
+    
+    def write(self, key, value):
+        """Write one member of the current object."""
+        indent = self._start_member(key)
+        self._file.write(json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n' + indent))
+    
+    def begin_object(self, key):
+        """Start a nested object member; close it with end_object()."""
+        self._start_member(key)
+        self._file.write('{')
+        self._empty.append(True)
+    
+    def end_object(self):
+        if self._empty.pop():
+            self._file.write('}')
+        else:
+            self._file.write('\n' + '  ' * len(self._empty) + '}')
+    
+    def commit(self):
+        """Finish the object and atomically replace the target file."""
+        try:
+            while len(self._empty) > 1:
+                self.end_object()
+            self.end_object()
+            if self.durable:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            self._file.close()
+            _commit_temp_file(self._temp_path, self.file_path, self.durable)
+        except Exception as e:
+            self.abort()
+            raise IOError(f"Error writing to {self.file_path}: {e}")
+    
+    def abort(self):
+        """Discard everything written so far and leave the target untouched."""
+        self._file.close()
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+
+class _JsonStream:
+    """Incremental JSON parser over a text file, reading it in chunks.
+    
+    Only object structure is tracked here; member values are decoded with
+    json.JSONDecoder.raw_decode once they are completely buffered.
+    """
+    
+    def __init__(self, f, chunk_size=1 << 16):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+    
+    def _fill(self):
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        # Drop what has already been consumed before appending
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+    
+    def peek(self):
+        """Return the next non-whitespace character without consuming it (None at EOF)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return None
+    
+    def _expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' but found {repr(found) if found else 'end of file'}")
+        self._pos += 1
+    
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number cut off by the end of the buffer may continue in the next chunk
+                if self._eof or (end < len(self._buffer) and self._buffer[end] in ' \t\r\n,:]}'):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise ValueError(str(e))
+            self._fill()
+    
+    def iter_object(self):
+        """Iterate over the keys of the object at the current position.
+        
+        After each key is yielded the caller must consume its value, either
+        with value() or by iterating a nested object with iter_object().
+        """
+        self._expect('{')
+        if self.peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError("Object keys must be strings")
+            self._expect(':')
+            yield key
+            if self.peek() == ',':
+                self._pos += 1
+            else:
+                self._expect('}')
+                return
+
+
+def iter_json_items(file_path, chunk_size=1 << 16):
+    """Yield the top-level (key, value) pairs of a JSON object file incrementally.
+    
+    Unlike read_json_file, only the member being decoded is held in memory.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            stream = _JsonStream(f, chunk_size)
+            if stream.peek() != '{':
+                raise ValueError("expected an object at the top level")
+            for key in stream.iter_object():
+                yield key, stream.value()
     except FileNotFoundError:
         raise FileNotFoundError(f"Error: {file_path} not found.")
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         raise ValueError(f"Error: Invalid JSON format in {file_path}: {e}")
 
 
-def translate_json(data, existing_translations, translator, progress_bar=None, verbose=False, max_retries=3):
-    """Translate JSON values, maintaining the same structure and order as parent.
-    
-    Args:
-        data: The parent JSON data to translate
-        existing_translations: Already translated data from output file (if exists)
-        translator: GoogleTranslator instance
-        progress_bar: Optional tqdm progress bar
-        verbose: Whether to show verbose output
-        max_retries: Maximum number of retry attempts for failed translations
+class _DiskIndex:
+    """Temporary on-disk key/value store for lookups over files too big for memory."""
     
-    Returns:
-        Tuple of (translated_data dict, stats dict)
-    """
-    if not isinstance(data, dict):
-        raise ValueError("Error: Input data must be a dictionary.")
+    def __init__(self):
+        # An empty filename gives a private temporary database on disk
+        self._conn = sqlite3.connect('')
+        self._conn.execute("CREATE TABLE entries (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
     
-    translated_data = {}
-    total_items = len(data)
+    def add_many(self, items):
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)",
+                ((key, json.dumps(value, ensure_ascii=False)) for key, value in items)
+            )
     
-    if total_items == 0:
-        print("Warning: No translation keys found in the JSON file.")
-        return data, {}
+    def clear(self):
+        with self._conn:
+            self._conn.execute("DELETE FROM entries")
     
-    # Track detailed statistics
-    skipped_keys = []
-    translated_keys = []
-    failed_keys = []
-    reorganized = False
+    def get_many(self, keys):
+        """Return a dict with the stored values of the given keys that exist."""
+        found = {}
+        keys = list(keys)
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for key, value in self._conn.execute(f"SELECT key, value FROM entries WHERE key IN ({placeholders})", chunk):
+                found[key] = json.loads(value)
+        return found
     
-    # Detect if reorganization is needed
-    if existing_translations:
-        existing_keys = list(existing_translations.keys())
-        parent_keys = list(data.keys())
-        # Check if existing keys exist in parent and are in different order
-        common_keys = [k for k in existing_keys if k in parent_keys]
-        if common_keys:
-            # Get the order of common keys in parent
-            parent_order = [k for k in parent_keys if k in common_keys]
-            reorganized = (common_keys != parent_order)
-    
-    # Process each key-value pair in parent file order
-    for key, value in data.items():
-        # Check if translation already exists
-        if key in existing_translations:
-            # Use existing translation
-            translated_data[key] = existing_translations[key]
-            skipped_keys.append(key)
-            if progress_bar:
-                progress_bar.update(1)
-                if verbose:
-                    progress_bar.set_postfix_str(f"Skipped: {key[:30]}..." if len(key) > 30 else f"Skipped: {key}")
-        else:
-            # Only translate string values
-            if isinstance(value, str):
-                # Retry logic - attempt translation up to max_retries times
-                for attempt in range(1, max_retries + 1):
-                    try:
-                        translated_text = translator.translate(value)
-                        translated_data[key] = translated_text
-                        translated_keys.append(key)
-                        
-                        # Update progress bar
-                        if progress_bar:
-                            progress_bar.update(1)
-                            if verbose:
-                                progress_bar.set_postfix_str(f"Translated: {key[:30]}..." if len(key) > 30 else f"Translated: {key}")
-                        break  # Success, exit retry loop
-                        
-                    except Exception as e:
-                        if attempt < max_retries:
-                            # Wait before retrying (exponential backoff)
-                            time.sleep(1 * attempt)
-                            if verbose:
-                                progress_bar.set_postfix_str(f"Retry {attempt}/{max_retries}: {key[:20]}...")
-                        else:
-                            # Final attempt failed
-                            if verbose:
-                                print(f"\nWarning: Failed to translate '{key}' after {max_retries} attempts: {e}")
-                            failed_keys.append(key)
-                            # Keep original value if all retries fail
-                            translated_data[key] = value
-                            if progress_bar:
-                                progress_bar.update(1)
-            else:
-                # Keep non-string values as-is
-                translated_data[key] = value
-                if progress_bar:
-                    progress_bar.update(1)
+    def positions(self, keys):
+        """Return a dict with the insertion order (a rising number) of the given keys that exist."""
+        found = {}
+        keys = list(keys)
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            found.update(self._conn.execute(f"SELECT key, rowid FROM entries WHERE key IN ({placeholders})", chunk))
+        return found
     
-    # Create statistics dictionary
-    stats = {
-        'total_keys': total_items,
-        'reorganized': reorganized,
-        'skipped': {
-            'count': len(skipped_keys),
-            'keys': skipped_keys
-        },
-        'translated': {
-            'count': len(translated_keys),
-            'keys': translated_keys
-        },
-        'failed': {
-            'count': len(failed_keys),
-            'keys': failed_keys
-        }
-    }
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
     
-    return translated_data, stats
+    def close(self):
+        self._conn.close()
 
 
-def write_json_file(data, file_path):
-    """Write JSON data to file with proper formatting."""
+def _index_json_items(file_path, batch=1000):
+    """Stream a JSON object file into a _DiskIndex."""
+    index = _DiskIndex()
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        raise IOError(f"Error writing to {file_path}: {e}")
+        items = []
+        for item in iter_json_items(file_path):
+            items.append(item)
+            if len(items) >= batch:
+                index.add_many(items)
+                items = []
+        index.add_many(items)
+    except BaseException:
+        index.close()
+        raise
+    return index
+
+
+def _index_journal(file_path, source_lang):
+    """Streaming counterpart of read_journal, returning a _DiskIndex or None."""
+    f = _open_journal(file_path, source_lang)
+    if f is None:
+        return None
+    index = _DiskIndex()
+    try:
+        with f:
+            index.add_many(_journal_entries(f))
+    except BaseException:
+        index.close()
+        raise
+    return index
 
 
-def main():
-    """Main function to orchestrate the translation process."""
+def _index_lock_file(file_path, source_lang, batch=1000):
+    """Streaming counterpart of read_lock_file, returning a _DiskIndex or None."""
+    if not os.path.exists(file_path):
+        return None
+    index = _DiskIndex()
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            stream = _JsonStream(f)
+            source = None
+            hashes_found = False
+            for key in stream.iter_object():
+                if key == 'source_hashes' and stream.peek() == '{':
+                    hashes_found = True
+                    items = []
+                    for hashed_key in stream.iter_object():
+                        items.append((hashed_key, stream.value()))
+                        if len(items) >= batch:
+                            index.add_many(items)
+                            items = []
+                    index.add_many(items)
+                else:
+                    value = stream.value()
+                    if key == 'source':
+                        source = value
+    except (ValueError, OSError):
+        index.close()
+        return None
+    if not hashes_found:
+        index.close()
+        return None
+    if source != source_lang:
+        # Written for another source language, so every key counts as changed
+        index.clear()
+    return index
+
+
+def _fsync_directory(directory):
+    """Persist a rename by syncing its directory (not supported on Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def main(argv=None):
+    """Main function to orchestrate the translation process.
+    
+    Args:
+        argv: Command line arguments; None means sys.argv. Runs started
+            from the command line are forwarded to a running daemon (see
+            serve()), while the daemon itself calls main() with argv.
+    """
     parser = argparse.ArgumentParser(
         description='Translate JSON files from one language to another',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -156,6 +2908,15 @@ Examples:
   %(prog)s -i en.json -o ar.json
   %(prog)s -i en.json -o es.json --source en --target es
   %(prog)s -i en.json -o fr.json -s en -t fr --verbose
+  %(prog)s en ar -w 8               # Translate with 8 concurrent requests
+  %(prog)s en ar --engine async     # Translate on an asyncio event loop
+  %(prog)s en ar --batch-size 50    # Pack up to 50 short values per request
+  %(prog)s en ar es fr de -p 4      # Translate four targets concurrently
+  %(prog)s en ar -w 16 --rate-limit 5 --adaptive-concurrency
+  %(prog)s en ar es --metrics-json metrics.json --metrics-prom intellator.prom
+  %(prog)s en ar es --watch         # Retranslate changed keys whenever en.json is saved
+  %(prog)s en ar es fr de --plan    # Estimate requests and time without translating
+  %(prog)s serve                    # Keep a daemon with warm caches running
         """
     )
     
@@ -207,7 +2968,361 @@ Examples:
         help='Output directory for translated files (default: current directory)'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=1,
+        help='Number of concurrent translation requests per target (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=1,
+        help='Pack up to N short values into a single request (default: 1, no batching)'
+    )
+    
+    parser.add_argument(
+        '--batch-chars',
+        type=int,
+        default=GOOGLE_MAX_CHARS,
+        help=f"Character limit for a batched request, capped at the backend's limit (default: {GOOGLE_MAX_CHARS})"
+    )
+    
+    parser.add_argument(
+        '-p', '--parallel-targets',
+        type=int,
+        default=1,
+        help='Number of target languages to translate concurrently (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--target-executor',
+        choices=['thread', 'process'],
+        default='thread',
+        help='Run parallel targets in threads or separate processes (default: thread)'
+    )
+    
+    parser.add_argument(
+        '--rate-limit',
+        type=float,
+        metavar='RPS',
+        help='Maximum requests per second across all workers and targets (default: unlimited)'
+    )
+    
+    parser.add_argument(
+        '--char-rate',
+        type=float,
+        metavar='CPS',
+        help='Maximum characters sent per second across all workers and targets (default: unlimited)'
+    )
+    
+    parser.add_argument(
+        '--adaptive-concurrency',
+        action='store_true',
+        help='Adjust in-flight requests (AIMD) based on throttling errors and latency'
+    )
+    
+    parser.add_argument(
+        '--breaker-threshold',
+        type=float,
+        default=0.5,
+        metavar='RATIO',
+        help='Failure rate over the last 20 requests that pauses all requests (default: 0.5)'
+    )
+    
+    parser.add_argument(
+        '--breaker-cooldown',
+        type=float,
+        default=10.0,
+        metavar='SECONDS',
+        help='Pause before probing the backend again, doubled while it keeps failing (default: 10)'
+    )
+    
+    parser.add_argument(
+        '--breaker-probes',
+        type=int,
+        default=3,
+        metavar='N',
+        help='Failed probes in a row after which the remaining requests fail (default: 3)'
+    )
+    
+    parser.add_argument(
+        '--no-circuit-breaker',
+        action='store_true',
+        help='Keep sending requests while the backend is throttling or failing'
+    )
+    
+    parser.add_argument(
+        '--max-retries',
+        type=int,
+        default=3,
+        metavar='N',
+        help='Maximum attempts per request; permanent errors are never retried (default: 3)'
+    )
+    
+    parser.add_argument(
+        '--retry-deadline',
+        type=float,
+        default=60.0,
+        metavar='SECONDS',
+        help='Stop retrying a value this long after its first attempt (default: 60)'
+    )
+    
+    parser.add_argument(
+        '--retry-budget',
+        type=float,
+        default=0.2,
+        metavar='RATIO',
+        help='Retries allowed per value attempted across a target, plus 10 (default: 0.2)'
+    )
+    
+    parser.add_argument(
+        '--checkpoint-every',
+        type=int,
+        default=500,
+        metavar='N',
+        help='Journal finished translations every N keys so a rerun resumes (default: 500, 0 = off)'
+    )
+    
+    parser.add_argument(
+        '--checkpoint-interval',
+        type=float,
+        default=60,
+        metavar='SECONDS',
+        help='Journal finished translations at least this often (default: 60, 0 = off)'
+    )
+    
+    parser.add_argument(
+        '--no-fsync',
+        action='store_true',
+        help='Skip fsync when writing output files (faster, but less crash-safe)'
+    )
+    
+    parser.add_argument(
+        '--nested',
+        action='store_true',
+        help='Also translate strings inside nested objects and arrays (e.g. i18next namespaces)'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Parse, translate and write large files incrementally with bounded memory'
+    )
+    
+    parser.add_argument(
+        '--stream-window',
+        type=int,
+        default=1000,
+        metavar='N',
+        help='Number of keys translated together in streaming mode (default: 1000)'
+    )
+    
+    parser.add_argument(
+        '--plan', '--dry-run',
+        dest='plan',
+        action='store_true',
+        help='Show the keys, characters, requests and projected time of each target without translating'
+    )
+    
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and retranslate only the changed keys whenever the input file is saved'
+    )
+    
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=0.3,
+        metavar='SECONDS',
+        help='Quiet period after a save before retranslating in watch mode (default: 0.3)'
+    )
+    
+    parser.add_argument(
+        '--tm',
+        type=str,
+        metavar='PATH',
+        help=f'Translation memory database shared across runs (default: {TranslationMemory.DEFAULT_PATH})'
+    )
+    
+    parser.add_argument(
+        '--no-tm',
+        action='store_true',
+        help='Disable the translation memory'
+    )
+    
+    parser.add_argument(
+        '--tm-max-entries',
+        type=int,
+        default=TranslationMemory.DEFAULT_MAX_ENTRIES,
+        help=f'Maximum translation memory entries before LRU eviction (default: {TranslationMemory.DEFAULT_MAX_ENTRIES})'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=sorted(BACKENDS),
+        default='google',
+        help='Translation backend: google, local-http (LibreTranslate-compatible server), '
+             'or the offline echo / pseudo backends (default: google)'
+    )
+    
+    parser.add_argument(
+        '--backend-url',
+        type=str,
+        metavar='URL',
+        help=f'Server URL for the local-http backend (default: {LocalHttpBackend.DEFAULT_URL})'
+    )
+    
+    parser.add_argument(
+        '--backend-api-key',
+        type=str,
+        metavar='KEY',
+        help='API key sent to the local-http backend'
+    )
+    
+    parser.add_argument(
+        '--list-languages',
+        action='store_true',
+        help='List the language codes supported by the selected backend and exit'
+    )
+    
+    parser.add_argument(
+        '--engine',
+        choices=['thread', 'async'],
+        default='thread',
+        help='Translation engine: thread pool or asyncio event loop (default: thread)'
+    )
+    
+    parser.add_argument(
+        '--async-backend',
+        choices=['executor', 'http'],
+        default='executor',
+        help='Backend for the async engine: GoogleTranslator in an executor, or native aiohttp (default: executor)'
+    )
+    
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=100,
+        help='Maximum in-flight requests for the async engine (default: 100)'
+    )
+    
+    parser.add_argument(
+        '--pool-size',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Keep-alive HTTP connections shared by all workers and targets '
+             '(default: 0 = one per concurrent request)'
+    )
+    
+    parser.add_argument(
+        '--no-http-pool',
+        action='store_true',
+        help="Open a new connection per request (deep_translator's default behaviour)"
+    )
+    
+    parser.add_argument(
+        '--metrics-json',
+        type=str,
+        metavar='PATH',
+        help='Write per-phase timings, request latency histograms and request counters as JSON'
+    )
+    
+    parser.add_argument(
+        '--metrics-prom',
+        type=str,
+        metavar='PATH',
+        help='Write the same metrics in Prometheus textfile format (e.g. for node_exporter)'
+    )
+    
+    parser.add_argument(
+        '--socket',
+        type=str,
+        metavar='PATH',
+        help='Unix socket of the daemon started with "serve" (default: $XDG_RUNTIME_DIR/intellator.sock)'
+    )
+    
+    parser.add_argument(
+        '--no-daemon',
+        action='store_true',
+        help='Run in this process even if a daemon is running'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    if args.workers < 1:
+        print("Error: --workers must be at least 1.")
+        sys.exit(1)
+    if args.batch_size < 1:
+        print("Error: --batch-size must be at least 1.")
+        sys.exit(1)
+    if args.batch_chars < 1:
+        print("Error: --batch-chars must be at least 1.")
+        sys.exit(1)
+    if args.concurrency < 1:
+        print("Error: --concurrency must be at least 1.")
+        sys.exit(1)
+    if args.parallel_targets < 1:
+        print("Error: --parallel-targets must be at least 1.")
+        sys.exit(1)
+    if args.rate_limit is not None and args.rate_limit <= 0:
+        print("Error: --rate-limit must be greater than 0.")
+        sys.exit(1)
+    if args.char_rate is not None and args.char_rate <= 0:
+        print("Error: --char-rate must be greater than 0.")
+        sys.exit(1)
+    if not 0 < args.breaker_threshold <= 1 or args.breaker_cooldown <= 0:
+        print("Error: --breaker-threshold must be in (0, 1] and --breaker-cooldown greater than 0.")
+        sys.exit(1)
+    if args.breaker_probes < 1:
+        print("Error: --breaker-probes must be at least 1.")
+        sys.exit(1)
+    if args.max_retries < 1:
+        print("Error: --max-retries must be at least 1.")
+        sys.exit(1)
+    if args.retry_deadline <= 0 or args.retry_budget < 0:
+        print("Error: --retry-deadline must be greater than 0 and --retry-budget can't be negative.")
+        sys.exit(1)
+    if args.checkpoint_every < 0 or args.checkpoint_interval < 0:
+        print("Error: --checkpoint-every and --checkpoint-interval can't be negative.")
+        sys.exit(1)
+    if args.stream_window < 1:
+        print("Error: --stream-window must be at least 1.")
+        sys.exit(1)
+    if args.tm_max_entries < 1:
+        print("Error: --tm-max-entries must be at least 1.")
+        sys.exit(1)
+    if args.pool_size < 0:
+        print("Error: --pool-size can't be negative.")
+        sys.exit(1)
+    if args.watch and args.stream:
+        print("Error: --watch can't be combined with --stream.")
+        sys.exit(1)
+    if args.debounce < 0:
+        print("Error: --debounce can't be negative.")
+        sys.exit(1)
+    if args.engine == 'async' and args.async_backend == 'http' and args.backend != 'google':
+        print("Error: --async-backend http is only available with --backend google.")
+        sys.exit(1)
+    
+    if args.list_languages:
+        _list_languages(args)
+        return
+    
+    socket_path = args.socket or _default_socket_path()
+    if args.languages[:1] == ['serve']:
+        serve(socket_path)
+        return
+    
+    # Hand the job to a running daemon, which streams our output back
+    # Watching runs in the foreground, so it is never handed to a daemon
+    if argv is None and not args.no_daemon and not args.watch:
+        exit_code = _forward_to_daemon(socket_path, sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
     
     # Handle positional arguments if provided
     if args.languages:
@@ -234,7 +3349,7 @@ Examples:
             sys.exit(1)
         
         # Create output directory if specified and doesn't exist
-        if args.output_dir and not os.path.exists(args.output_dir):
+        if args.output_dir and not os.path.exists(args.output_dir) and not args.plan:
             try:
                 os.makedirs(args.output_dir)
                 print(f"Created output directory: {args.output_dir}")
@@ -242,19 +3357,23 @@ Examples:
                 print(f"Error: Failed to create output directory '{args.output_dir}': {e}")
                 sys.exit(1)
         
-        # Read input file once for all targets (optimization)
-        print(f"Reading {args.input}...")
-        try:
-            input_data = read_json_file(args.input)
-        except Exception as e:
-            print(f"Error reading input file: {e}")
-            sys.exit(1)
-        
-        # Track results for each language
-        results = []
+        # Read input file once for all targets (optimization); in streaming
+        # mode each target parses it incrementally instead
+        run_start = time.time()
+        run_phases = {}
+        input_data = None
+        if not args.stream:
+            print(f"Reading {args.input}...")
+            try:
+                input_data = _read_input_file(args.input)
+            except Exception as e:
+                print(f"Error reading input file: {e}")
+                sys.exit(1)
+            run_phases['read_input'] = time.time() - run_start
         
-        # Process each target language
-        for target_lang in target_langs:
+        # Build the task for each target language
+        target_tasks = []
+        for position, target_lang in enumerate(target_langs):
             # Create a copy of args for each target
             target_args = argparse.Namespace(**vars(args))
             target_args.target = target_lang
@@ -275,14 +3394,42 @@ Examples:
                     else:
                         target_args.output = output_filename
             
-            # Process this translation with pre-loaded input data
+            # Stack progress bars of concurrently running targets
+            if args.parallel_targets > 1:
+                target_args.progress_position = position
+            target_tasks.append(target_args)
+        
+        if args.plan:
+            _plan_targets(args, target_tasks, input_data)
+            return
+        
+        # Process each target language with pre-loaded input data
+        if args.parallel_targets > 1 and len(target_tasks) > 1 and args.target_executor == 'process':
+            # Each process opens its own translation memory and rate limiter
+            from concurrent.futures import ProcessPoolExecutor
+            from tqdm import tqdm
+            with ProcessPoolExecutor(max_workers=args.parallel_targets,
+                                     initializer=tqdm.set_lock, initargs=(tqdm.get_lock(),)) as executor:
+                results = list(executor.map(_run_target_in_process, target_tasks, [input_data] * len(target_tasks)))
+        else:
+            # Share one translation memory, rate limiter and connection pool across all targets
+            memory = _open_translation_memory(args)
+            limiter = _create_rate_limiter(args)
+            http_pool = _create_http_pool(args)
             try:
-                _process_translation(target_args, input_data)
-                results.append({'lang': target_lang, 'success': True, 'error': None})
-            except Exception as e:
-                results.append({'lang': target_lang, 'success': False, 'error': str(e)})
-                print(f"\n❌ Error translating to {target_lang}: {e}")
-                print(f"➡️  Continuing with remaining languages...\n")
+                if args.parallel_targets > 1 and len(target_tasks) > 1:
+                    results = _run_targets_in_threads(args, target_tasks, input_data, memory, limiter, http_pool)
+                else:
+                    results = [_run_target(task, input_data, memory, limiter, http_pool) for task in target_tasks]
+            finally:
+                if memory is not None:
+                    memory.close()
+                if http_pool is not None:
+                    http_pool.close()
+        
+        if args.metrics_json or args.metrics_prom:
+            _write_metrics(args, run_start, run_phases,
+                           [dict(r['metrics'], success=r['success']) for r in results])
         
         # Display summary if multiple targets
         if len(target_langs) > 1:
@@ -304,6 +3451,8 @@ Examples:
             
             print(f"\n{'='*80}\n")
         
+        if args.watch:
+            watch_and_translate(args, target_tasks, input_data)
         return  # Exit after processing all targets
     
     # No positional arguments, use flags or defaults
@@ -314,15 +3463,227 @@ Examples:
     if not args.input:
         args.input = 'en.json'
     
-    _process_translation(args)
+    if args.plan:
+        _plan_targets(args, [args])
+        return
+    
+    memory = _open_translation_memory(args)
+    http_pool = _create_http_pool(args)
+    metrics = TargetMetrics(args.source, args.target) if args.metrics_json or args.metrics_prom else None
+    run_start = time.time()
+    success = False
+    try:
+        _process_translation(args, memory=memory, limiter=_create_rate_limiter(args), metrics=metrics,
+                             http_pool=http_pool)
+        success = True
+    finally:
+        if memory is not None:
+            memory.close()
+        if http_pool is not None:
+            http_pool.close()
+        if metrics is not None:
+            _write_metrics(args, run_start, {}, [dict(metrics.to_dict(), success=success)])
+    
+    if args.watch:
+        watch_and_translate(args, [args])
+
+
+def _run_target(target_args, input_data, memory=None, limiter=None, http_pool=None, stop_event=None):
+    """Translate one target of a multi-target run and report the outcome.
+    
+    Args:
+        target_args: Arguments namespace for this target
+        input_data: Input data shared by all targets
+        memory: Optional TranslationMemory shared across targets
+        limiter: Optional RateLimiter shared across targets
+        http_pool: Optional HttpSessionPool shared across targets
+        stop_event: Optional threading.Event interrupting the target once set
+    
+    Returns:
+        Dict with 'lang', 'success' and 'error' for the batch summary, and
+        'metrics' (a TargetMetrics dict) when metrics output is enabled
+    """
+    target_lang = target_args.target
+    metrics = None
+    if target_args.metrics_json or target_args.metrics_prom:
+        metrics = TargetMetrics(target_args.source, target_lang)
+    result = {'lang': target_lang, 'success': True, 'error': None}
+    try:
+        _process_translation(target_args, input_data, memory, limiter, metrics, http_pool, stop_event)
+    except Exception as e:
+        with _OUTPUT_LOCK:
+            print(f"\n❌ Error translating to {target_lang}: {e}")
+            print(f"➡️  Continuing with remaining languages...\n")
+        result.update(success=False, error=str(e))
+    if metrics is not None:
+        result['metrics'] = metrics.to_dict()
+    return result
+
+
+def _run_targets_in_threads(args, target_tasks, input_data, memory, limiter, http_pool):
+    """Run targets on a thread pool, stopping them cleanly on Ctrl+C.
+    
+    Only the main thread sees KeyboardInterrupt, so it sets a stop event
+    that the running targets check between requests: each one checkpoints
+    what finished and reports the interruption itself, and targets that
+    haven't started are cancelled.
+    """
+    stop_event = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=args.parallel_targets)
+    futures = [executor.submit(_run_target, task, input_data, memory, limiter, http_pool, stop_event)
+               for task in target_tasks]
+    try:
+        return [future.result() for future in futures]
+    except KeyboardInterrupt:
+        stop_event.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+        # Targets stopped mid-translation exit through _process_translation,
+        # which already said where their progress was saved
+        if not any(not future.cancelled() and isinstance(future.exception(), SystemExit) for future in futures):
+            print("\n\nTranslation interrupted by user.")
+        sys.exit(1)
+    finally:
+        # Already finished unless a second Ctrl+C cut the wait short
+        executor.shutdown(wait=False)
+
+
+def _run_target_in_process(target_args, input_data):
+    """Entry point for targets run in a worker process.
+    
+    Memory, rate limiter and connection pool can't be shared across processes,
+    so each worker opens its own and gets an equal share of the rate limits.
+    """
+    memory = _open_translation_memory(target_args)
+    http_pool = _create_http_pool(target_args, share=target_args.parallel_targets)
+    try:
+        limiter = _create_rate_limiter(target_args, share=target_args.parallel_targets)
+        return _run_target(target_args, input_data, memory, limiter, http_pool)
+    finally:
+        if memory is not None:
+            memory.close()
+        if http_pool is not None:
+            http_pool.close()
+
+
+def _create_rate_limiter(args, share=1):
+    """Create the RateLimiter configured on the command line, or None if unlimited.
+    
+    Args:
+        args: Arguments namespace with rate limit settings
+        share: Number of processes splitting the configured limits
+    """
+    breaker = None
+    if not args.no_circuit_breaker:
+        breaker = CircuitBreaker(threshold=args.breaker_threshold, cooldown=args.breaker_cooldown,
+                                 max_probes=args.breaker_probes)
+    if not (args.rate_limit or args.char_rate or args.adaptive_concurrency or breaker):
+        return None
+    max_concurrency = None
+    if args.adaptive_concurrency:
+        # Upper bound is the concurrency the run would use without adaptation
+        per_target = args.concurrency if args.engine == 'async' else args.workers
+        max_concurrency = per_target * (args.parallel_targets if share == 1 else 1)
+    return RateLimiter(
+        requests_per_second=args.rate_limit / share if args.rate_limit else None,
+        chars_per_second=args.char_rate / share if args.char_rate else None,
+        max_concurrency=max_concurrency,
+        breaker=breaker
+    )
+
+
+def _write_metrics(args, run_start, phases, targets):
+    """Write run metrics to the files given with --metrics-json / --metrics-prom.
+    
+    Args:
+        args: Arguments namespace
+        run_start: Unix time the run started
+        phases: Timings of phases shared by all targets (e.g. read_input)
+        targets: TargetMetrics dicts, each with a 'success' flag
+    """
+    run = {
+        'timestamp': round(run_start, 3),
+        'wall_time': round(time.time() - run_start, 6),
+        'phases': {name: round(seconds, 6) for name, seconds in phases.items()},
+        'targets': targets
+    }
+    try:
+        if args.metrics_json:
+            write_json_file(run, args.metrics_json, not args.no_fsync)
+        if args.metrics_prom:
+            text = format_prometheus_metrics(run)
+            _write_file_atomically(args.metrics_prom, lambda f: f.write(text), not args.no_fsync)
+    except IOError as e:
+        print(f"Warning: Could not write metrics: {e}")
 
 
-def _process_translation(args, input_data=None):
+def _list_languages(args):
+    """Print the languages supported by the backend selected on the command line."""
+    try:
+        backend = create_backend(args.backend, args.source or 'auto', args.target or 'en',
+                                 url=args.backend_url, api_key=args.backend_api_key)
+        languages = backend.supported_languages()
+    except Exception as e:
+        print(f"Error: Could not list languages for the {args.backend} backend: {e}")
+        sys.exit(1)
+    if languages is None:
+        print(f"The {args.backend} backend accepts any language code.")
+        return
+    for name, code in sorted(languages.items(), key=lambda item: item[1]):
+        print(f"{code:<10} {name}")
+
+
+def _create_http_pool(args, share=1):
+    """Create the keep-alive connection pool for Google requests, or None if disabled.
+    
+    Args:
+        args: Arguments namespace with connection pool settings
+        share: Number of processes each opening their own pool
+    """
+    if args.no_http_pool:
+        return None
+    pool_size = args.pool_size
+    if not pool_size:
+        # One connection per request that can be in flight at once
+        per_target = args.concurrency if args.engine == 'async' else args.workers
+        pool_size = per_target * (args.parallel_targets if share == 1 else 1)
+    # Checked without importing requests, which is only loaded on first use
+    if importlib.util.find_spec('requests') is None:
+        print("Warning: requests is not installed, so HTTP connections can't be pooled. "
+              "Install it with: pip install requests")
+        return None
+    if _daemon_cache is not None:
+        return _daemon_cache.http_pool(pool_size)
+    return HttpSessionPool(pool_size)
+
+
+def _open_translation_memory(args):
+    """Open the translation memory selected on the command line, or None if disabled."""
+    if args.no_tm:
+        return None
+    try:
+        if _daemon_cache is not None:
+            return _daemon_cache.memory(args.tm or TranslationMemory.DEFAULT_PATH, args.tm_max_entries)
+        return TranslationMemory(args.tm or TranslationMemory.DEFAULT_PATH, args.tm_max_entries)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Warning: Could not open translation memory: {e}")
+        return None
+
+
+def _process_translation(args, input_data=None, memory=None, limiter=None, metrics=None, http_pool=None, stop_event=None):
     """Process a single translation task.
     
     Args:
         args: Arguments namespace with translation settings
         input_data: Optional pre-loaded input data (optimization for multiple targets)
+        memory: Optional TranslationMemory shared across targets
+        limiter: Optional RateLimiter shared across targets
+        metrics: Optional TargetMetrics collecting timings and request counters
+        http_pool: Optional HttpSessionPool shared across targets; when given,
+            requests reuse its keep-alive connections
+        stop_event: Optional threading.Event set to interrupt the task like
+            Ctrl+C (used when targets run in threads)
     """
     
     # Use language codes directly from args
@@ -338,145 +3699,180 @@ def _process_translation(args, input_data=None):
     # Check if output file exists
     output_exists = os.path.exists(args.output)
     existing_translations = {}
+    source_hashes = None
+    
+    # In streaming mode existing translations are indexed on disk instead of loaded
+    load_existing = _index_json_items if args.stream else read_json_file
+    load_start = time.time()
     
     if output_exists:
         if not args.overwrite:
             # Load existing translations to skip them
             try:
                 print(f"Output file '{args.output}' exists. Loading existing translations...")
-                existing_translations = read_json_file(args.output)
+                existing_translations = load_existing(args.output)
                 print(f"Found {len(existing_translations)} existing translation(s).")
             except Exception as e:
-                print(f"Warning: Could not load existing translations: {e}")
-                response = input(f"Continue and overwrite '{args.output}'? (y/N): ")
+                with _OUTPUT_LOCK:
+                    print(f"Warning: Could not load existing translations: {e}")
+                    try:
+                        response = input(f"Continue and overwrite '{args.output}'? (y/N): ")
+                    except EOFError:
+                        # Nobody to answer (daemon jobs, closed stdin): keep the file
+                        print()
+                        response = ''
                 if response.lower() not in ['y', 'yes']:
                     print("Translation cancelled.")
                     sys.exit(0)
         else:
             # Overwrite mode - still load existing to potentially skip
             try:
-                existing_translations = read_json_file(args.output)
+                existing_translations = load_existing(args.output)
                 print(f"Loading {len(existing_translations)} existing translation(s) to skip...")
             except Exception:
                 pass  # File might not be valid JSON, will overwrite anyway
+        
+        # Source hashes from the previous run tell us which keys were edited
+        if existing_translations:
+            if args.stream:
+                source_hashes = _index_lock_file(lock_file_path(args.output), source_lang)
+            else:
+                source_hashes = read_lock_file(lock_file_path(args.output), source_lang)
+    if metrics is not None:
+        metrics.add_time('load_existing', time.time() - load_start)
     
     try:
         # Start timing
         start_time = time.time()
         
-        # Read the input JSON file (only if not already provided)
-        if input_data is None:
-            # Check if input file exists
+        if args.stream:
+            # The input is parsed incrementally while translating
             if not os.path.exists(args.input):
                 raise FileNotFoundError(f"Input file '{args.input}' not found in {os.getcwd()}")
+            print(f"Streaming {args.input} in windows of {args.stream_window} key(s)...")
+            total_keys = None
+        else:
+            # Read the input JSON file (only if not already provided)
+            if input_data is None:
+                # Check if input file exists
+                if not os.path.exists(args.input):
+                    raise FileNotFoundError(f"Input file '{args.input}' not found in {os.getcwd()}")
+                
+                print(f"Reading {args.input}...")
+                read_start = time.time()
+                input_data = _read_input_file(args.input)
+                if metrics is not None:
+                    metrics.add_time('read_input', time.time() - read_start)
             
-            print(f"Reading {args.input}...")
-            input_data = read_json_file(args.input)
-        
-        # Count total keys
-        total_keys = len(input_data) if isinstance(input_data, dict) else 0
-        
-        if total_keys == 0:
-            raise ValueError("No keys found in the input file")
-        
-        print(f"Found {total_keys} translation key(s) in parent file.")
+            # Count total keys
+            total_keys = len(input_data) if isinstance(input_data, dict) else 0
+            
+            if total_keys == 0:
+                raise ValueError("No keys found in the input file")
+            
+            print(f"Found {total_keys} translation key(s) in parent file.")
+            
+            if args.nested:
+                # Progress is reported per leaf value in nested mode
+                total_keys = _count_leaves(input_data)
+                print(f"Found {total_keys} value(s) including nested objects and arrays.")
+            
+            # Everything is translated already: no backend, progress bar or network needed
+            if not needs_translation(input_data, existing_translations, source_hashes, args.nested):
+                _finish_without_translating(args, input_data, existing_translations, source_hashes,
+                                            metrics, start_time)
+                return
         
         # Initialize translator
-        print(f"Initializing Google Translator ({source_lang} -> {target_lang})...")
-        try:
-            translator = GoogleTranslator(source=source_lang, target=target_lang)
-        except Exception as e:
-            error_msg = str(e)
-            if "-->" in error_msg:
-                error_msg = error_msg.split("-->", 1)[1].strip()
-            error_msg = error_msg.split('\n')[0].strip()
-            raise ValueError(f"{error_msg} Refer documentation for supported languages.")
+        engine_translator, engine_options = _create_engine(args, source_lang, target_lang, memory, limiter,
+                                                           http_pool, metrics)
+        engine_options['stop_event'] = stop_event
         
         # Create progress bar
+        from tqdm import tqdm
         progress_bar = tqdm(
             total=total_keys,
-            desc="Processing",
+            desc=f"Processing {target_lang}" if getattr(args, 'progress_position', None) is not None else "Processing",
             unit="key",
-            bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed} <{remaining}, {rate_fmt}]'
+            bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed} <{remaining}, {rate_fmt}]',
+            position=getattr(args, 'progress_position', None)
         )
         
-        # Translate the JSON data
-        translated_data, stats = translate_json(input_data, existing_translations, translator, progress_bar, args.verbose)
-        
-        # Close progress bar
-        progress_bar.close()
+        # Translate the JSON data; finished keys are journaled next to the
+        # output until it is written, so a rerun resumes from there
+        journal = journal_path(args.output)
         
-        # Calculate elapsed time
-        elapsed_time = time.time() - start_time
+        def save_checkpoint(entries):
+            append_journal(journal, source_lang, entries, not args.no_fsync)
         
-        # Write translated data to output file
-        print(f"\nWriting content to {args.output}...")
-        write_json_file(translated_data, args.output)
-        
-        # Display comprehensive statistics
-        print(f"\n{'='*80}")
-        print(f"✅ TRANSLATION COMPLETE")
-        print(f"{'='*80}")
-        
-        # Time statistics
-        hours, remainder = divmod(int(elapsed_time), 3600)
-        minutes, seconds = divmod(remainder, 60)
-        time_str = ""
-        if hours > 0:
-            time_str = f"{hours}h {minutes}m {seconds}s"
-        elif minutes > 0:
-            time_str = f"{minutes}m {seconds}s"
+        checkpoint_options = dict(checkpoint=save_checkpoint, checkpoint_every=args.checkpoint_every,
+                                  checkpoint_interval=args.checkpoint_interval)
+        if args.stream:
+            # Output is written window by window into a temporary file, so an
+            # interrupted run resumes from the journal (indexed on disk here)
+            journal_index = _index_journal(journal, source_lang)
+            if journal_index is None:
+                remove_journal(journal)  # Written for another source language, if at all
+            elif len(journal_index):
+                print(f"Resuming {len(journal_index)} checkpointed translation(s) from '{journal}'.")
+            stream_start = time.time()
+            try:
+                stats = translate_json_stream(args.input, args.output, existing_translations or None, source_hashes,
+                                              engine_translator, source_lang, progress_bar, args.verbose,
+                                              window=args.stream_window, durable=not args.no_fsync,
+                                              journal_index=journal_index, **checkpoint_options, **engine_options)
+            finally:
+                for index in (existing_translations, source_hashes, journal_index):
+                    if isinstance(index, _DiskIndex):
+                        index.close()
+            remove_journal(journal)
+            if stats['total_keys'] == 0:
+                raise ValueError("No keys found in the input file")
+            if metrics is not None:
+                # Parsing and writing are interleaved with translation, so the
+                # time left over after plan/translate is reported as stream_io
+                spent = metrics.phases.get('plan', 0.0) + metrics.phases.get('translate', 0.0)
+                metrics.add_time('stream_io', max(time.time() - stream_start - spent, 0.0))
+            translate_seconds = time.time() - stream_start
+            progress_bar.close()
+            elapsed_time = time.time() - start_time
+            print(f"\nWrote content to {args.output}")
         else:
-            time_str = f"{elapsed_time:.2f}s"
-        
-        print(f"\n⏱️  Time Elapsed: {time_str}")
-        
-        # Translation rate
-        if elapsed_time > 0:
-            rate = stats['total_keys'] / elapsed_time
-            print(f"📊 Translation Rate: {rate:.2f} keys/second")
-        
-        # Overall statistics
-        print(f"\n📈 Overall Statistics:")
-        print(f"   Total Keys in Parent: {stats['total_keys']}")
-        print(f"   ├─ Skipped (existed): {stats['skipped']['count']}")
-        print(f"   ├─ Newly Translated:  {stats['translated']['count']}")
-        print(f"   └─ Failed:            {stats['failed']['count']}")
-        
-        # Show reorganization notice if it happened
-        if stats.get('reorganized', False):
-            print(f"\n🔄 File was reorganized to match parent key order")
-        
-        # Skipped translations
-        if stats['skipped']['count'] > 0:
-            print(f"\n⏭️  Skipped Translations ({stats['skipped']['count']}):")
-            # Show first 10 skipped keys, or all if less than 10
-            display_limit = 10
-            for i, key in enumerate(stats['skipped']['keys'][:display_limit]):
-                print(f"   {i+1}. {key}")
-            if stats['skipped']['count'] > display_limit:
-                print(f"   ... and {stats['skipped']['count'] - display_limit} more")
-        
-        # Newly translated
-        if stats['translated']['count'] > 0:
-            print(f"\n✨ Newly Translated ({stats['translated']['count']}):")
-            # Show first 10 translated keys, or all if less than 10
-            display_limit = 10
-            for i, key in enumerate(stats['translated']['keys'][:display_limit]):
-                print(f"   {i+1}. {key}")
-            if stats['translated']['count'] > display_limit:
-                print(f"   ... and {stats['translated']['count'] - display_limit} more")
-        
-        # Failed translations
-        if stats['failed']['count'] > 0:
-            print(f"\n❌ Failed Translations ({stats['failed']['count']}):")
-            for i, key in enumerate(stats['failed']['keys']):
-                print(f"   {i+1}. {key}")
-            print(f"   Note: Original values have been preserved for failed translations.")
-        
-        print(f"\n💾 Output File: {args.output}")
-        print(f"🌐 Languages: {source_lang.upper()} → {target_lang.upper()}")
-        print(f"\n{'='*80}\n")
+            resumed = read_journal(journal, source_lang)
+            if resumed is None:
+                remove_journal(journal)  # Written for another source language, if at all
+            elif resumed:
+                print(f"Resuming {len(resumed)} checkpointed translation(s) from '{journal}'.")
+            translate_start = time.time()
+            translated_data, stats = translate_json(input_data, existing_translations, engine_translator, progress_bar, args.verbose,
+                                                    source_hashes=source_hashes, resumed=resumed,
+                                                    **checkpoint_options, **engine_options)
+            translate_seconds = time.time() - translate_start
+            
+            # Close progress bar
+            progress_bar.close()
+            
+            # Calculate elapsed time
+            elapsed_time = time.time() - start_time
+            
+            # Write translated data to output file
+            print(f"\nWriting content to {args.output}...")
+            write_start = time.time()
+            write_json_file(translated_data, args.output, not args.no_fsync)
+            write_lock_file(lock_file_path(args.output), source_lang, stats['source_hashes'], not args.no_fsync)
+            remove_journal(journal)
+            if metrics is not None:
+                metrics.add_time('write', time.time() - write_start)
+        
+        # Best-effort, and unrelated to the translation memory, so --no-tm
+        # runs and daemon jobs contribute too
+        record_throughput(args.backend, stats['requests'], translate_seconds, engine_options['workers'])
+        if metrics is not None:
+            metrics.record_stats(stats)
+        
+        # Display comprehensive statistics (in one piece when targets run in parallel)
+        with _OUTPUT_LOCK:
+            _print_report(stats, args, elapsed_time)
         
     except FileNotFoundError as e:
         print(f"\n✗ {e}", file=sys.stderr)
@@ -488,11 +3884,778 @@ def _process_translation(args, input_data=None):
         raise
     except KeyboardInterrupt:
         print("\n\nTranslation interrupted by user.")
+        if os.path.exists(journal_path(args.output)):
+            print(f"Progress so far was saved to '{journal_path(args.output)}'; run again to resume.")
+        elif args.stream:
+            print("Finished translations were kept in the translation memory; run again to resume.")
         sys.exit(1)
     except Exception as e:
         raise
 
 
+def _pair_memory(memory, backend, source_lang, target_lang):
+    """Return the translation memory view for a language pair and backend, or None."""
+    if memory is None:
+        return None
+    # Other backends get their own memory entries so e.g. pseudo-localized
+    # text is never reused as a Google translation
+    memory_target = target_lang if backend == 'google' else f"{target_lang}@{backend}"
+    return memory.pair(source_lang, memory_target)
+
+
+def _create_engine(args, source_lang, target_lang, memory=None, limiter=None, http_pool=None, metrics=None):
+    """Create the translator and translate_json options for one target.
+    
+    Args:
+        args: Arguments namespace with backend and engine settings
+        source_lang: Source language code
+        target_lang: Target language code
+        memory: Optional TranslationMemory shared across targets
+        limiter: Optional RateLimiter shared across targets
+        http_pool: Optional HttpSessionPool shared across targets
+        metrics: Optional TargetMetrics for this target
+    
+    Returns:
+        Tuple of (translator or async backend, keyword options for translate_json)
+    """
+    print(f"Initializing {BACKENDS[args.backend].description} ({source_lang} -> {target_lang})...")
+    translator = create_backend(args.backend, source_lang, target_lang, http_pool=http_pool,
+                                url=args.backend_url, api_key=args.backend_api_key)
+    
+    if args.engine == 'async':
+        # Drive requests from a single event loop through an async backend
+        if args.async_backend == 'http':
+            engine_translator = GoogleHttpBackend(source_lang, target_lang)
+        else:
+            engine_translator = translator.async_backend(max_workers=args.concurrency)
+        workers = args.concurrency
+    else:
+        engine_translator, workers = translator, args.workers
+    
+    pair_memory = _pair_memory(memory, args.backend, source_lang, target_lang)
+    
+    # One retry budget for every request of this target
+    retry_policy = RetryPolicy(max_attempts=args.max_retries, deadline=args.retry_deadline,
+                               budget=args.retry_budget, metrics=metrics)
+    
+    # Respect the backend's request size and batching capabilities
+    engine_options = dict(workers=workers, engine=args.engine, retry_policy=retry_policy,
+                          batch_size=args.batch_size if translator.supports_batch else 1,
+                          batch_chars=min(args.batch_chars, translator.max_chars), max_chars=translator.max_chars,
+                          memory=pair_memory, limiter=limiter, nested=args.nested, metrics=metrics)
+    return engine_translator, engine_options
+
+
+def _finish_without_translating(args, input_data, existing_translations, source_hashes, metrics, start_time):
+    """Complete a task whose values are all translated without initializing a backend.
+    
+    The output and lock files are only rewritten when the key order or the
+    recorded source hashes are out of date.
+    """
+    translated_data, stats = translate_json(input_data, existing_translations, None, source_hashes=source_hashes,
+                                            nested=args.nested, metrics=metrics)
+    # Left behind by a run interrupted after writing its output
+    remove_journal(journal_path(args.output))
+    up_to_date = (source_hashes == stats['source_hashes']
+                  and json.dumps(translated_data) == json.dumps(existing_translations))
+    if up_to_date:
+        with _OUTPUT_LOCK:
+            print(f"✅ '{args.output}' is up to date ({stats['total_keys']} key(s)), nothing to translate.")
+    else:
+        print(f"\nWriting content to {args.output}...")
+        write_start = time.time()
+        write_json_file(translated_data, args.output, not args.no_fsync)
+        write_lock_file(lock_file_path(args.output), args.source, stats['source_hashes'], not args.no_fsync)
+        if metrics is not None:
+            metrics.add_time('write', time.time() - write_start)
+        with _OUTPUT_LOCK:
+            _print_report(stats, args, time.time() - start_time)
+    if metrics is not None:
+        metrics.record_stats(stats)
+
+
+def _format_duration(seconds):
+    """Render a duration as e.g. '1h 2m 3s', '2m 3s' or '4.56s'."""
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, whole_seconds = divmod(remainder, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m {whole_seconds}s"
+    if minutes > 0:
+        return f"{minutes}m {whole_seconds}s"
+    return f"{seconds:.2f}s"
+
+
+def _plan_targets(args, target_tasks, input_data=None):
+    """Print what translating each target would take, without translating (--plan).
+    
+    Nothing is sent to the backend and no file is written. Projected times
+    come from the throughput recorded by earlier runs with the same backend
+    and from the configured rate limits.
+    
+    Args:
+        args: Arguments namespace of the run
+        target_tasks: Arguments namespace of each target (output, target, ...)
+        input_data: Input data, if already parsed
+    """
+    if input_data is None:
+        try:
+            input_data = _read_input_file(args.input)
+        except Exception as e:
+            print(f"Error reading input file: {e}")
+            sys.exit(1)
+    if not isinstance(input_data, dict) or not input_data:
+        print("Error: No keys found in the input file")
+        sys.exit(1)
+    
+    # Reading the memory is fine, creating it is not
+    memory = None
+    if not args.no_tm and (_daemon_cache is not None or os.path.exists(args.tm or TranslationMemory.DEFAULT_PATH)):
+        memory = _open_translation_memory(args)
+    
+    backend = BACKENDS[args.backend]
+    batch_size = args.batch_size if backend.supports_batch else 1
+    batch_chars = min(args.batch_chars, backend.max_chars)
+    concurrency = args.concurrency if args.engine == 'async' else args.workers
+    measured = read_throughput_history().get(args.backend)
+    if not isinstance(measured, dict) or not measured.get('seconds_per_request'):
+        measured = None
+    
+    def projected_seconds(plan):
+        bounds = []
+        if measured is not None:
+            bounds.append(plan['requests'] * measured['seconds_per_request'] / concurrency)
+        if args.rate_limit:
+            bounds.append(plan['requests'] / args.rate_limit)
+        if args.char_rate:
+            bounds.append(plan['characters'] / args.char_rate)
+        return max(bounds) if bounds else None
+    
+    # Flatten and hash the parent once for all targets
+    data = flatten_json(input_data)[0] if args.nested else input_data
+    current_hashes = None
+    
+    rows = []
+    try:
+        for task in target_tasks:
+            output = task.output or f"{os.path.splitext(args.input)[0]}_{task.target}.json"
+            existing_translations = {}
+            source_hashes = None
+            if os.path.exists(output):
+                try:
+                    existing_translations = read_json_file(output)
+                except Exception as e:
+                    print(f"Warning: Could not load existing translations from {output}: {e}")
+                if existing_translations:
+                    source_hashes = read_lock_file(lock_file_path(output), args.source)
+                if args.nested and existing_translations:
+                    existing_translations = flatten_json(existing_translations)[0]
+            if source_hashes is not None and current_hashes is None:
+                current_hashes = {key: _source_hash(value) for key, value in data.items()}
+            plan = plan_translation(data, existing_translations, source_hashes,
+                                    _pair_memory(memory, args.backend, args.source, task.target),
+                                    batch_size, batch_chars, backend.max_chars, current_hashes=current_hashes)
+            rows.append((task.target, plan, projected_seconds(plan)))
+    finally:
+        if memory is not None:
+            memory.close()
+    
+    columns = ('to_translate', 'changed', 'memory_hits', 'unique', 'characters', 'requests')
+    print(f"\n{'='*80}")
+    print(f"📝 TRANSLATION PLAN ({args.source.upper()} → {len(rows)} target(s), nothing is translated or written)")
+    print(f"{'='*80}\n")
+    print(f"{'Target':<8}{'To translate':>13}{'Changed':>9}{'Memory':>9}{'Unique':>9}"
+          f"{'Characters':>12}{'Requests':>10}{'Projected':>12}")
+    totals = dict.fromkeys(columns, 0)
+    for target, plan, seconds in rows:
+        for column in columns:
+            totals[column] += plan[column]
+        projected = _format_duration(seconds) if seconds is not None else 'n/a'
+        print(f"{target.upper():<8}{plan['to_translate']:>13,}{plan['changed']:>9,}{plan['memory_hits']:>9,}"
+              f"{plan['unique']:>9,}{plan['characters']:>12,}{plan['requests']:>10,}{projected:>12}")
+    
+    if len(rows) > 1:
+        # Targets running in parallel overlap their time
+        known = [seconds for _, _, seconds in rows if seconds is not None]
+        total_time = sum(known) / min(args.parallel_targets, len(rows)) if len(known) == len(rows) else None
+        projected = _format_duration(total_time) if total_time is not None else 'n/a'
+        print(f"{'TOTAL':<8}{totals['to_translate']:>13,}{totals['changed']:>9,}{totals['memory_hits']:>9,}"
+              f"{totals['unique']:>9,}{totals['characters']:>12,}{totals['requests']:>10,}{projected:>12}")
+    
+    print()
+    if measured is not None:
+        updated = time.strftime('%Y-%m-%d %H:%M', time.localtime(measured.get('updated', 0)))
+        print(f"⏱️  Projected from measured {args.backend} throughput: {measured['seconds_per_request']:.3f}s "
+              f"per request with {measured.get('concurrency', '?')} in flight (last run {updated}), "
+              f"at {concurrency} in flight")
+    elif args.rate_limit or args.char_rate:
+        print(f"⏱️  Projected from the configured rate limits; no measured {args.backend} throughput yet")
+    else:
+        print(f"⏱️  No measured {args.backend} throughput yet; projections appear after the first real run")
+    print(f"{'='*80}\n")
+
+
+def _print_report(stats, args, elapsed_time):
+    """Print the statistics report for one finished translation task.
+    
+    Args:
+        stats: Statistics dict returned by translate_json
+        args: Arguments namespace of the task
+        elapsed_time: Wall time of the task in seconds
+    """
+    source_lang = args.source
+    target_lang = args.target
+    
+    # Display comprehensive statistics
+    print(f"\n{'='*80}")
+    print(f"✅ TRANSLATION COMPLETE")
+    print(f"{'='*80}")
+    
+    # Time statistics
+    print(f"\n⏱️  Time Elapsed: {_format_duration(elapsed_time)}")
+    
+    # Translation rate
+    if elapsed_time > 0:
+        rate = stats['total_keys'] / elapsed_time
+        print(f"📊 Translation Rate: {rate:.2f} keys/second")
+    
+    # Overall statistics
+    print(f"\n📈 Overall Statistics:")
+    print(f"   Total Keys in Parent: {stats['total_keys']}")
+    print(f"   ├─ Skipped (existed): {stats['skipped']['count']}")
+    print(f"   ├─ Newly Translated:  {stats['translated']['count']}")
+    print(f"   └─ Failed:            {stats['failed']['count']}")
+    
+    # Show keys retranslated because their source text changed
+    if stats['changed']['count'] > 0:
+        print(f"\n🔁 Source changed for {stats['changed']['count']} key(s), retranslated")
+    
+    # Show requests saved by translating repeated values once
+    if stats.get('deduplicated'):
+        print(f"\n♻️  {stats['deduplicated']} repeated value(s) shared a single translation")
+    
+    # Show translation memory reuse
+    if stats.get('memory_hits'):
+        print(f"\n🧠 Reused {stats['memory_hits']} translation(s) from translation memory")
+    
+    # Show reorganization notice if it happened
+    if stats.get('reorganized', False):
+        print(f"\n🔄 File was reorganized to match parent key order")
+    
+    # Skipped translations
+    if stats['skipped']['count'] > 0:
+        print(f"\n⏭️  Skipped Translations ({stats['skipped']['count']}):")
+        # Show first 10 skipped keys, or all if less than 10
+        display_limit = 10
+        for i, key in enumerate(stats['skipped']['keys'][:display_limit]):
+            print(f"   {i+1}. {key}")
+        if stats['skipped']['count'] > display_limit:
+            print(f"   ... and {stats['skipped']['count'] - display_limit} more")
+    
+    # Newly translated
+    if stats['translated']['count'] > 0:
+        print(f"\n✨ Newly Translated ({stats['translated']['count']}):")
+        # Show first 10 translated keys, or all if less than 10
+        display_limit = 10
+        for i, key in enumerate(stats['translated']['keys'][:display_limit]):
+            print(f"   {i+1}. {key}")
+        if stats['translated']['count'] > display_limit:
+            print(f"   ... and {stats['translated']['count'] - display_limit} more")
+    
+    # Failed translations
+    if stats['failed']['count'] > 0:
+        print(f"\n❌ Failed Translations ({stats['failed']['count']}):")
+        for i, key in enumerate(stats['failed']['keys']):
+            print(f"   {i+1}. {key}")
+        print(f"   Note: Original values have been preserved for failed translations.")
+    
+    print(f"\n💾 Output File: {args.output}")
+    print(f"🌐 Languages: {source_lang.upper()} → {target_lang.upper()}")
+    print(f"\n{'='*80}\n")
+
+
+class FileWatcher:
+    """Wait for a file to be saved, using inotify on Linux and polling elsewhere.
+    
+    The parent directory is watched rather than the file itself, so saves
+    that replace the file (as most editors do) are seen as well.
+    """
+    
+    # inotify event masks (see <sys/inotify.h>)
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    
+    def __init__(self, file_path, poll_interval=0.5):
+        self.file_path = os.path.abspath(file_path)
+        self.poll_interval = poll_interval
+        self._fd = None
+        self._signature = self._stat()
+        if sys.platform.startswith('linux'):
+            self._fd = self._init_inotify()
+    
+    def _init_inotify(self):
+        """Start watching the file's directory, or return None to fall back to polling."""
+        import ctypes
+        import ctypes.util
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(fd, os.path.dirname(self.file_path).encode(), mask) < 0:
+            os.close(fd)
+            return None
+        return fd
+    
+    def _stat(self):
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    def _read_events(self, timeout):
+        """Return True if the watched file changed within timeout seconds (inotify)."""
+        import select
+        import struct
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        name = os.path.basename(self.file_path).encode()
+        changed = False
+        offset = 0
+        while offset + 16 <= len(buffer):
+            _, _, _, length = struct.unpack_from('iIII', buffer, offset)
+            if buffer[offset + 16:offset + 16 + length].rstrip(b'\0') == name:
+                changed = True
+            offset += 16 + length
+        return changed
+    
+    def _changed(self, timeout):
+        if self._fd is not None:
+            return self._read_events(timeout)
+        time.sleep(min(timeout, self.poll_interval))
+        signature = self._stat()
+        if signature != self._signature:
+            self._signature = signature
+            return True
+        return False
+    
+    def wait(self, debounce=0.3):
+        """Block until the file changes and then stays quiet for debounce seconds."""
+        while not self._changed(3600):
+            pass
+        # Editors often write in several steps; wait for the burst to end
+        while self._changed(debounce):
+            pass
+    
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _same_json_value(a, b):
+    """Compare JSON values without treating 1, 1.0 and True as equal."""
+    return type(a) is type(b) and a == b
+
+
+def watch_and_translate(args, target_tasks, input_data=None):
+    """Retranslate added and changed keys whenever the input file is saved.
+    
+    Runs after the initial translation. Each save is parsed and diffed
+    against the previous parse, and only the keys that differ (plus keys
+    that failed before) are sent to the backend, for every target. Output
+    and lock files are rewritten atomically once the save settles.
+    
+    Args:
+        args: Arguments namespace of the run
+        target_tasks: Arguments namespace of each target (output, target, ...)
+        input_data: Input data of the initial run, if already parsed
+    """
+    def flat(data):
+        return flatten_json(data) if args.nested else (data, None)
+    
+    snapshot = flat(input_data if input_data is not None else read_json_file(args.input))[0]
+    
+    # Translations and source hashes of each target as of the initial run
+    states = {}
+    for task in target_tasks:
+        translated = flat(read_json_file(task.output))[0] if os.path.exists(task.output) else {}
+        hashes = read_lock_file(lock_file_path(task.output), args.source) or {}
+        states[task.target] = {'translated': translated, 'hashes': hashes, 'engine': None, 'engine_error': None}
+    
+    # Backends are created on the first change and kept warm between saves
+    memory = _open_translation_memory(args)
+    limiter = _create_rate_limiter(args)
+    http_pool = _create_http_pool(args)
+    watcher = FileWatcher(args.input)
+    mode = 'inotify' if watcher._fd is not None else 'polling'
+    print(f"\n👀 Watching {args.input} for changes ({mode}, Ctrl+C to stop)...")
+    try:
+        while True:
+            watcher.wait(args.debounce)
+            try:
+                data, paths = flat(read_json_file(args.input))
+            except Exception as e:
+                print(f"Warning: Skipping this save of {args.input}: {e}")
+                continue
+            
+            changed = [key for key, value in data.items()
+                       if key not in snapshot or not _same_json_value(snapshot[key], value)]
+            removed = [key for key in snapshot if key not in data]
+            reordered = not changed and not removed and list(snapshot) != list(data)
+            snapshot = data
+            if not (changed or removed or reordered):
+                continue
+            print(f"\n🔁 {args.input} changed: {len(changed)} added/changed, {len(removed)} removed")
+            
+            for task in target_tasks:
+                state = states[task.target]
+                # Keys without a source hash failed earlier and are retried too
+                pending = set(changed)
+                pending.update(key for key, value in data.items()
+                               if key not in state['hashes'] and isinstance(value, str))
+                # One failing target must not stop the others or the watcher
+                try:
+                    _apply_watch_changes(task, state, data, paths, pending, memory, limiter, http_pool)
+                except Exception as e:
+                    print(f"   ❌ {task.target.upper()}: {e}")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
+        if memory is not None:
+            memory.close()
+        if http_pool is not None:
+            http_pool.close()
+
+
+def _apply_watch_changes(task, state, data, paths, pending, memory, limiter, http_pool):
+    """Translate the pending keys of one target and rewrite its output atomically."""
+    subset = {key: data[key] for key in data if key in pending}
+    translated_subset = {}
+    new_hashes = {}
+    translated_count = 0
+    failed = []
+    if subset:
+        if state['engine_error'] is not None:
+            raise state['engine_error']
+        if state['engine'] is None:
+            try:
+                state['engine'] = _create_engine(task, task.source, task.target, memory, limiter, http_pool)
+            except Exception as e:
+                # Remembered so the backend isn't initialized again on every save
+                state['engine_error'] = e
+                raise
+        engine_translator, engine_options = state['engine']
+        # The diff is already flat, so translate it as plain keys
+        translated_subset, stats = translate_json(subset, {}, engine_translator, None, task.verbose,
+                                                  **dict(engine_options, nested=False))
+        new_hashes = stats['source_hashes']
+        translated_count = stats['translated']['count']
+        failed = stats['failed']['keys']
+    
+    translated = {}
+    for key, value in data.items():
+        if key in translated_subset:
+            translated[key] = translated_subset[key]
+        else:
+            translated[key] = state['translated'].get(key, value)
+    hashes = {key: source_hash for key, source_hash in state['hashes'].items()
+              if key in data and key not in subset}
+    hashes.update(new_hashes)
+    
+    output = unflatten_json(translated, paths) if paths is not None else translated
+    write_json_file(output, task.output, not task.no_fsync)
+    write_lock_file(lock_file_path(task.output), task.source, hashes, not task.no_fsync)
+    state['translated'] = translated
+    state['hashes'] = hashes
+    
+    status = f"{translated_count} translated"
+    if failed:
+        status += f", {len(failed)} failed"
+    print(f"   ✨ {task.target.upper()}: {status} → {task.output}")
+
+
+def _read_input_file(file_path):
+    """Read a parent JSON file, reusing the daemon's parse while the file is unchanged."""
+    if _daemon_cache is not None:
+        return _daemon_cache.read_json(file_path)
+    return read_json_file(file_path)
+
+
+def _default_socket_path():
+    """Return the default Unix socket path of the daemon."""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'intellator.sock')
+    return os.path.join(_default_cache_dir(), 'daemon.sock')
+
+
+class _SharedResource:
+    """Proxy for a resource owned by the daemon; jobs may use it but not close it."""
+    
+    def __init__(self, resource):
+        self._resource = resource
+    
+    def __getattr__(self, name):
+        return getattr(self._resource, name)
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def close(self):
+        pass
+
+
+class DaemonCache:
+    """State kept warm between jobs by the daemon.
+    
+    Translation memories, connection pools and backends are created on first
+    use and reused by later jobs; parsed input files are reused until their
+    size or modification time changes.
+    """
+    
+    def __init__(self):
+        self._memories = {}
+        self._pools = {}
+        self._backends = {}
+        self._files = {}
+        self._lock = threading.Lock()
+    
+    def memory(self, path, max_entries):
+        with self._lock:
+            key = (os.path.abspath(path), max_entries)
+            if key not in self._memories:
+                self._memories[key] = _SharedResource(TranslationMemory(path, max_entries))
+            return self._memories[key]
+    
+    def http_pool(self, pool_size):
+        with self._lock:
+            if pool_size not in self._pools:
+                self._pools[pool_size] = _SharedResource(HttpSessionPool(pool_size))
+            return self._pools[pool_size]
+    
+    def backend(self, name, source, target, **options):
+        # Options hold the (daemon-owned) pool, so identity is a stable key
+        key = (name, source, target) + tuple(sorted((option, id(value) if isinstance(value, _SharedResource) else value)
+                                                    for option, value in options.items()))
+        with self._lock:
+            if key not in self._backends:
+                self._backends[key] = BACKENDS[name](source, target, **options)
+            return self._backends[key]
+    
+    def read_json(self, file_path):
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._files.get(path)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+        data = read_json_file(path)
+        with self._lock:
+            self._files[path] = (version, data)
+        return data
+    
+    def close(self):
+        for resource in list(self._memories.values()) + list(self._pools.values()):
+            resource._resource.close()
+
+
+# Set while serving; makes the helpers above reuse warm resources
+_daemon_cache = None
+
+# The daemon runs one job at a time, since jobs redirect stdout/stderr and chdir
+_DAEMON_JOB_LOCK = threading.Lock()
+
+
+class _SocketStream:
+    """File-like object forwarding writes to a daemon client as JSON lines."""
+    
+    encoding = 'utf-8'
+    
+    def __init__(self, connection, name):
+        self._connection = connection
+        self._name = name
+        self.disconnected = False
+    
+    def write(self, text):
+        if text and not self.disconnected:
+            message = json.dumps({'stream': self._name, 'data': text}) + '\n'
+            try:
+                self._connection.sendall(message.encode('utf-8'))
+            except OSError:
+                # Client went away; finish the job anyway so files stay consistent
+                self.disconnected = True
+        return len(text)
+    
+    def flush(self):
+        pass
+    
+    def isatty(self):
+        return False
+
+
+def serve(socket_path):
+    """Run the daemon: accept jobs on a Unix socket until interrupted.
+    
+    Each client sends one JSON line {"argv": [...], "cwd": "..."} with the
+    command line it was started with. The job runs through main() with warm
+    caches, its stdout/stderr are streamed back as {"stream", "data"} lines
+    and a final {"exit": code} line ends the connection.
+    
+    Args:
+        socket_path: Path of the Unix domain socket to listen on
+    """
+    global _daemon_cache
+    import signal
+    import socket
+    
+    if _daemon_cache is not None:
+        print("Error: Already running as a daemon.")
+        sys.exit(1)
+    if not hasattr(socket, 'AF_UNIX'):
+        print("Error: The daemon requires Unix domain sockets, which this platform lacks.")
+        sys.exit(1)
+    if os.path.exists(socket_path):
+        if _forward_to_daemon(socket_path, None) is not None:
+            print(f"Error: A daemon is already listening on {socket_path}")
+            sys.exit(1)
+        os.unlink(socket_path)  # Left behind by a daemon that didn't shut down cleanly
+    
+    os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Create the socket owner-only, so other local users never get a chance
+    # to connect (no other threads are running yet to see the umask change)
+    umask = os.umask(0o177)
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(umask)
+    server.listen()
+    _daemon_cache = DaemonCache()
+    print(f"Intellator daemon listening on {socket_path} (Ctrl+C to stop)")
+    
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+    
+    # Shut down cleanly when stopped by a service manager as well
+    signal.signal(signal.SIGTERM, stop)
+    
+    try:
+        while True:
+            connection, _ = server.accept()
+            threading.Thread(target=_serve_client, args=(connection,), daemon=True).start()
+    except KeyboardInterrupt:
+        print("\nStopping daemon...")
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        _daemon_cache.close()
+        _daemon_cache = None
+
+
+def _serve_client(connection):
+    """Run one job sent by a daemon client."""
+    import contextlib
+    import traceback
+    
+    with connection:
+        try:
+            with connection.makefile('r', encoding='utf-8') as reader:
+                request = json.loads(reader.readline() or 'null')
+        except (OSError, ValueError):
+            return
+        if not isinstance(request, dict) or 'argv' not in request:
+            return  # Liveness probe or malformed request
+        
+        stdout = _SocketStream(connection, 'stdout')
+        stderr = _SocketStream(connection, 'stderr')
+        exit_code = 0
+        with _DAEMON_JOB_LOCK:
+            previous_cwd = os.getcwd()
+            previous_stdin = sys.stdin
+            # Jobs can't prompt the client, so input() sees end of file
+            sys.stdin = open(os.devnull)
+            try:
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                    try:
+                        os.chdir(request.get('cwd') or previous_cwd)
+                        main(request['argv'])
+                    except SystemExit as e:
+                        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                        if isinstance(e.code, str):
+                            print(e.code, file=sys.stderr)
+                    except BaseException:
+                        traceback.print_exc()
+                        exit_code = 1
+            finally:
+                sys.stdin.close()
+                sys.stdin = previous_stdin
+                os.chdir(previous_cwd)
+        
+        if not stdout.disconnected:
+            try:
+                connection.sendall((json.dumps({'exit': exit_code}) + '\n').encode('utf-8'))
+            except OSError:
+                pass
+
+
+def _forward_to_daemon(socket_path, argv):
+    """Run a job on the daemon listening on socket_path, if there is one.
+    
+    Args:
+        socket_path: Path of the daemon's Unix socket
+        argv: Command line arguments to run, or None to only check that the
+            daemon is alive
+    
+    Returns:
+        The job's exit code (0 for a liveness check), or None if no daemon
+        is listening
+    """
+    if not os.path.exists(socket_path):
+        return None
+    import socket
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        client.close()
+        return None  # Stale socket file
+    
+    with client:
+        if argv is None:
+            return 0
+        request = {'argv': argv, 'cwd': os.getcwd()}
+        client.sendall((json.dumps(request) + '\n').encode('utf-8'))
+        streams = {'stdout': sys.stdout, 'stderr': sys.stderr}
+        with client.makefile('r', encoding='utf-8') as reader:
+            for line in reader:
+                message = json.loads(line)
+                if 'exit' in message:
+                    return message['exit']
+                stream = streams.get(message.get('stream'), sys.stdout)
+                stream.write(message.get('data', ''))
+                stream.flush()
+    print("Error: The daemon closed the connection before the job finished.", file=sys.stderr)
+    return 1
+
+
 if __name__ == "__main__":
     main()
 
@@ -0,0 +1,59 @@
+"""Tests for CircuitBreaker: an unreachable backend must end the run, not stall it.
+
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import intellator
+
+
+class DownTranslator:
+    """Every request fails like a refused connection."""
+
+    def translate(self, text):
+        time.sleep(0.001)
+        raise ConnectionError("Connection refused")
+
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def translate(self, breaker, retry_policy, engine='thread'):
+        data = {f'k{i}': f'Hello {i}' for i in range(40)}
+        limiter = intellator.RateLimiter(breaker=breaker)
+        start = time.monotonic()
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, stats = intellator.translate_json(data, {}, DownTranslator(), workers=4, engine=engine,
+                                                 limiter=limiter, retry_policy=retry_policy)
+        return stats, time.monotonic() - start
+
+    def test_failing_backend_gives_up_after_probes(self):
+        for engine in ('thread', 'async'):
+            breaker = intellator.CircuitBreaker(cooldown=0.05, max_probes=3)
+            stats, elapsed = self.translate(breaker, intellator.RetryPolicy(base_delay=0.01), engine)
+            self.assertEqual(stats['failed']['count'], 40, engine)
+            self.assertEqual(breaker.state, intellator.CircuitBreaker.FAILED)
+            self.assertLess(elapsed, 10, engine)
+
+    def test_breaker_wait_counts_against_retry_deadline(self):
+        # Probes alone would keep the run going for hours
+        breaker = intellator.CircuitBreaker(cooldown=0.5, max_cooldown=300, max_probes=1000)
+        retry_policy = intellator.RetryPolicy(base_delay=0.01, deadline=1.0)
+        stats, elapsed = self.translate(breaker, retry_policy)
+        self.assertEqual(stats['failed']['count'], 40)
+        self.assertLess(elapsed, 10)
+
+    def test_circuit_open_error_is_not_retried(self):
+        error = intellator.CircuitOpenError("Backend kept failing: Too many requests (HTTP 429)")
+        self.assertEqual(intellator.classify_error(error), 'permanent')
+
+
+if __name__ == '__main__':
+    unittest.main()
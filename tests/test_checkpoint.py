@@ -0,0 +1,94 @@
+"""Tests for checkpointing: an interrupted run resumes from its journal.
+
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import intellator
+
+
+class InterruptingTranslator:
+    """Upper-cases texts and raises KeyboardInterrupt after `limit` requests."""
+
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.texts = []
+
+    def translate(self, text):
+        if self.limit is not None and len(self.texts) >= self.limit:
+            raise KeyboardInterrupt
+        self.texts.append(text)
+        return text.upper()
+
+
+class CheckpointJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.work = tempfile.TemporaryDirectory()
+        self.journal = os.path.join(self.work.name, 'fr.json.journal')
+
+    def tearDown(self):
+        self.work.cleanup()
+
+    def run_json(self, data, translator, resumed=None, **options):
+        def checkpoint(entries):
+            intellator.append_journal(self.journal, 'en', entries, durable=False)
+        return intellator.translate_json(data, {}, translator, checkpoint=checkpoint, checkpoint_every=10,
+                                         resumed=resumed, **options)
+
+    def test_interrupted_run_resumes_from_journal(self):
+        data = {f'k{i}': f'value {i}' for i in range(100)}
+        data['count'] = 3
+        with self.assertRaises(KeyboardInterrupt):
+            self.run_json(data, InterruptingTranslator(limit=45))
+
+        resumed = intellator.read_journal(self.journal, 'en')
+        self.assertEqual(len(resumed), 45)
+        self.assertEqual(resumed['k0'], ('VALUE 0', intellator._source_hash('value 0')))
+
+        translator = InterruptingTranslator()
+        translated, stats = self.run_json(data, translator, resumed=resumed)
+        self.assertEqual(len(translator.texts), 55)
+        self.assertEqual(translated, {key: value.upper() if isinstance(value, str) else value
+                                      for key, value in data.items()})
+        self.assertEqual(list(translated), list(data))
+        self.assertEqual(stats['skipped']['count'], 45)
+
+    def test_changed_source_is_translated_again(self):
+        data = {f'k{i}': f'value {i}' for i in range(20)}
+        with self.assertRaises(KeyboardInterrupt):
+            self.run_json(data, InterruptingTranslator(limit=15))
+        data['k0'] = 'edited'
+
+        translator = InterruptingTranslator()
+        translated, _ = self.run_json(data, translator, resumed=intellator.read_journal(self.journal, 'en'))
+        self.assertIn('edited', translator.texts)
+        self.assertEqual(translated['k0'], 'EDITED')
+
+    def test_each_checkpoint_only_appends_new_keys(self):
+        data = {f'k{i}': f'value {i}' for i in range(95)}
+        batches = []
+        intellator.translate_json(data, {}, InterruptingTranslator(), checkpoint=batches.append,
+                                  checkpoint_every=10)
+        self.assertEqual(sum(len(entries) for entries in batches), 90)
+        self.assertTrue(all(len(entries) == 10 for entries in batches))
+
+    def test_journal_ignored_for_other_source_language(self):
+        intellator.append_journal(self.journal, 'de', [('k0', 'x', 'hash')], durable=False)
+        self.assertIsNone(intellator.read_journal(self.journal, 'en'))
+
+    def test_torn_last_line_is_skipped(self):
+        intellator.append_journal(self.journal, 'en', [('k0', 'A', 'h0'), ('k1', 'B', 'h1')], durable=False)
+        with open(self.journal, 'a', encoding='utf-8') as f:
+            f.write('["k2", "C"')
+        self.assertEqual(intellator.read_journal(self.journal, 'en'), {'k0': ('A', 'h0'), 'k1': ('B', 'h1')})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""Tests for the translation engines (_translate_pending and its async counterpart).
+
+    python -m unittest discover tests
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import intellator
+
+
+class StoppingTranslator:
+    """Upper-cases texts and sets stop_event after `limit` requests."""
+
+    def __init__(self, stop_event, limit):
+        self.stop_event = stop_event
+        self.limit = limit
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def translate(self, text):
+        time.sleep(0.005)
+        with self._lock:
+            self.count += 1
+            if self.count >= self.limit:
+                self.stop_event.set()
+        return text.upper()
+
+
+class FailingTranslator:
+    """Upper-cases texts; 'bad' texts always fail, 'flaky' ones fail on their first request."""
+
+    def __init__(self):
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def translate(self, text):
+        with self._lock:
+            self.requests.append(text)
+            first = self.requests.count(text) == 1
+        if 'bad' in text:
+            raise RuntimeError("HTTP 400: Bad Request")
+        if 'flaky' in text and first:
+            raise ConnectionError("Connection reset by peer")
+        return text.upper()
+
+
+class TranslatePendingTest(unittest.TestCase):
+
+    def data(self):
+        data = {}
+        for i in range(30):
+            kind = 'bad' if i % 7 == 3 else 'flaky' if i % 5 == 1 else 'good'
+            data[f'k{i}'] = f'{kind} value {i}'
+        return data
+
+    def retry_policy(self):
+        return intellator.RetryPolicy(base_delay=0.001, max_delay=0.01)
+
+    def test_single_worker_yields_in_batch_order(self):
+        batches = [[(f'k{i}', f'value {i}')] for i in range(20)]
+        results = list(intellator._translate_pending(batches, FailingTranslator(), workers=1))
+        self.assertEqual(results, [(f'k{i}', f'VALUE {i}', None) for i in range(20)])
+
+    def test_every_key_is_reported_once(self):
+        data = self.data()
+        for workers in (1, 4):
+            translator = FailingTranslator()
+            batches = [[item] for item in data.items()]
+            results = {}
+            for key, translated_text, error in intellator._translate_pending(batches, translator, workers=workers,
+                                                                             retry_policy=self.retry_policy()):
+                self.assertNotIn(key, results, workers)
+                results[key] = (translated_text, error)
+            self.assertEqual(set(results), set(data), workers)
+            for key, value in data.items():
+                translated_text, error = results[key]
+                if value.startswith('bad'):
+                    self.assertIsNone(translated_text, key)
+                    self.assertIsInstance(error, RuntimeError, key)
+                else:
+                    self.assertEqual(translated_text, value.upper(), key)
+                    self.assertIsNone(error, key)
+
+    def test_translate_json_keeps_order_and_counts_failures(self):
+        data = self.data()
+        data['count'] = 3
+        for engine in ('thread', 'async'):
+            translator = FailingTranslator()
+            translated, stats = intellator.translate_json(data, {}, translator, workers=4, engine=engine,
+                                                          retry_policy=self.retry_policy())
+            bad = [key for key, value in data.items() if isinstance(value, str) and value.startswith('bad')]
+            flaky = [key for key, value in data.items() if isinstance(value, str) and value.startswith('flaky')]
+            self.assertEqual(list(translated), list(data), engine)
+            self.assertEqual(stats['failed']['keys'], bad, engine)
+            self.assertEqual(stats['translated']['count'], 30 - len(bad), engine)
+            # Failed keys keep their source text; one retry per flaky key
+            self.assertEqual([translated[key] for key in bad], [data[key] for key in bad], engine)
+            self.assertEqual(stats['requests'], len(translator.requests), engine)
+            self.assertEqual(stats['requests'], 30 + len(flaky), engine)
+
+
+class StopEventTest(unittest.TestCase):
+
+    def batches(self, count=50):
+        return [[(f'k{i}', f'value {i}')] for i in range(count)]
+
+    def test_thread_engine_yields_in_flight_results_then_stops(self):
+        for workers in (1, 4):
+            stop_event = threading.Event()
+            translator = StoppingTranslator(stop_event, limit=10)
+            results = []
+            with self.assertRaises(KeyboardInterrupt):
+                for result in intellator._translate_pending(self.batches(), translator, workers=workers,
+                                                            stop_event=stop_event):
+                    results.append(result)
+            # Everything that was sent is reported, nothing more is sent
+            self.assertEqual(len(results), translator.count, workers)
+            self.assertLess(translator.count, 10 + workers + 1, workers)
+
+    def test_async_engine_stops(self):
+        stop_event = threading.Event()
+        translator = StoppingTranslator(stop_event, limit=10)
+        results = []
+        backend = intellator.ExecutorBackend(translator, max_workers=4)
+        with self.assertRaises(KeyboardInterrupt):
+            asyncio.run(intellator._translate_pending_async(self.batches(), backend,
+                                                            lambda *result: results.append(result),
+                                                            concurrency=4, stop_event=stop_event))
+        self.assertEqual(len(results), translator.count)
+        self.assertLess(translator.count, 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
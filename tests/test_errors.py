@@ -0,0 +1,49 @@
+"""Tests for classify_error, which drives retries, the rate limiter and metrics.
+
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import intellator
+
+
+class Response:
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class ResponseError(Exception):
+
+    def __init__(self, status_code):
+        super().__init__(f"{status_code} error")
+        self.response = Response(status_code)
+
+
+class ClassifyErrorTest(unittest.TestCase):
+
+    def test_throttling(self):
+        for error in (RuntimeError("Too many requests (HTTP 429)"),
+                      RuntimeError("429 Client Error: Too Many Requests"),
+                      ResponseError(429)):
+            self.assertEqual(intellator.classify_error(error), 'throttle', error)
+
+    def test_429_inside_other_numbers_is_not_throttling(self):
+        error = ValueError("Text must be at most 5000 characters, got 5429")
+        self.assertEqual(intellator.classify_error(error), 'permanent')
+        self.assertEqual(intellator.classify_error(RuntimeError("timed out after 4290 ms")), 'transient')
+
+    def test_http_status(self):
+        self.assertEqual(intellator.classify_error(RuntimeError("HTTP 404: Not Found")), 'permanent')
+        self.assertEqual(intellator.classify_error(ResponseError(403)), 'permanent')
+        self.assertEqual(intellator.classify_error(ResponseError(408)), 'transient')
+        self.assertEqual(intellator.classify_error(RuntimeError("HTTP 503: Unavailable")), 'transient')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Tests for RetryPolicy: each reason for giving up on a failed request.
+
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import intellator
+
+
+TRANSIENT = ConnectionError("Connection refused")
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    def policy(self, **options):
+        self.metrics = intellator.TargetMetrics(None, None)
+        options.setdefault('base_delay', 0.01)
+        return intellator.RetryPolicy(metrics=self.metrics, **options)
+
+    def assertGaveUp(self, reason):
+        self.assertEqual(self.metrics.retry_decisions['give_up'], {reason: 1})
+
+    def test_transient_error_is_retried_with_backoff(self):
+        policy = self.policy(base_delay=0.5, max_delay=30.0)
+        delay = policy.next_delay(TRANSIENT, 1, 0, policy.start())
+        self.assertGreaterEqual(delay, 0.5)
+        self.assertLessEqual(delay, 1.5)
+        self.assertEqual(self.metrics.retry_decisions['retry'], {'transient': 1})
+
+    def test_throttling_starts_from_a_longer_delay(self):
+        policy = self.policy(base_delay=0.5)
+        delay = policy.next_delay(RuntimeError("Too many requests (HTTP 429)"), 1, 0, policy.start())
+        self.assertGreaterEqual(delay, 0.5 * intellator.RetryPolicy.THROTTLE_DELAY_FACTOR)
+
+    def test_gives_up_on_permanent_error(self):
+        policy = self.policy()
+        self.assertIsNone(policy.next_delay(RuntimeError("HTTP 404: Not Found"), 1, 0, policy.start()))
+        self.assertGaveUp('permanent')
+
+    def test_gives_up_after_max_attempts(self):
+        policy = self.policy(max_attempts=3)
+        started = policy.start()
+        self.assertIsNotNone(policy.next_delay(TRANSIENT, 2, 0, started))
+        self.assertIsNone(policy.next_delay(TRANSIENT, 3, 0, started))
+        self.assertGaveUp('attempts')
+
+    def test_gives_up_past_deadline(self):
+        policy = self.policy(deadline=1.0)
+        started = policy.start() - 1.0
+        self.assertIsNone(policy.next_delay(TRANSIENT, 1, 0, started))
+        self.assertGaveUp('deadline')
+
+    def test_gives_up_when_budget_is_spent(self):
+        policy = self.policy(max_attempts=100, budget=0.5, min_budget=2)
+        for _ in range(4):
+            policy.start()
+        # min_budget plus half of the four values
+        delays = [policy.next_delay(TRANSIENT, 1, 0, time.monotonic()) for _ in range(5)]
+        self.assertEqual([delay is not None for delay in delays], [True] * 4 + [False])
+        self.assertGaveUp('budget')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Smoke test for --stream, run offline with the pseudo backend.
+
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import intellator
+from test_checkpoint import InterruptingTranslator
+
+try:
+    import tqdm  # noqa: F401
+except ImportError:
+    tqdm = None
+
+
+@unittest.skipIf(tqdm is None, "tqdm is not installed")
+class StreamTest(unittest.TestCase):
+
+    def test_stream_translates_and_writes_lock(self):
+        source = {'greeting': 'Hello', 'farewell': 'Bye', 'count': 3, 'empty': ''}
+        with tempfile.TemporaryDirectory() as work:
+            with open(os.path.join(work, 'en.json'), 'w', encoding='utf-8') as f:
+                json.dump(source, f)
+
+            cwd = os.getcwd()
+            os.chdir(work)
+            try:
+                with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': os.path.join(work, 'cache')}), \
+                        contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                    intellator.main(['en', 'es', '--stream', '--backend', 'pseudo', '--no-tm', '--no-http-pool'])
+            finally:
+                os.chdir(cwd)
+
+            with open(os.path.join(work, 'es.json'), encoding='utf-8') as f:
+                translated = json.load(f)
+            self.assertEqual(list(translated), list(source))
+            self.assertNotEqual(translated['greeting'], 'Hello')
+            self.assertEqual(translated['count'], 3)
+
+            lock = intellator.read_lock_file(intellator.lock_file_path(os.path.join(work, 'es.json')), 'en')
+            self.assertEqual(set(lock), set(source))
+
+
+class StreamCheckpointTest(unittest.TestCase):
+
+    def test_interrupted_stream_resumes_from_journal(self):
+        source = {f'k{i}': f'value {i}' for i in range(100)}
+        with tempfile.TemporaryDirectory() as work:
+            input_path = os.path.join(work, 'en.json')
+            output_path = os.path.join(work, 'fr.json')
+            journal = intellator.journal_path(output_path)
+            with open(input_path, 'w', encoding='utf-8') as f:
+                json.dump(source, f)
+
+            def run(translator):
+                journal_index = intellator._index_journal(journal, 'en')
+                try:
+                    return intellator.translate_json_stream(
+                        input_path, output_path, None, None, translator, 'en', window=30, durable=False,
+                        journal_index=journal_index, checkpoint_every=10,
+                        checkpoint=lambda entries: intellator.append_journal(journal, 'en', entries, durable=False))
+                finally:
+                    if journal_index is not None:
+                        journal_index.close()
+
+            with self.assertRaises(KeyboardInterrupt):
+                run(InterruptingTranslator(limit=45))
+            self.assertFalse(os.path.exists(output_path))
+            self.assertEqual(len(intellator.read_journal(journal, 'en')), 45)
+
+            translator = InterruptingTranslator()
+            stats = run(translator)
+            self.assertEqual(len(translator.texts), 55)
+            self.assertEqual(stats['skipped']['count'], 45)
+            self.assertEqual(stats['requests'], 55)
+            with open(output_path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f), {key: value.upper() for key, value in source.items()})
+
+
+if __name__ == '__main__':
+    unittest.main()